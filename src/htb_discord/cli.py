@@ -5,6 +5,7 @@ import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import Optional
 
 from .service import HTBDiscordService
 
@@ -34,8 +35,13 @@ def main() -> None:
     parser.add_argument(
         "--log-level", "-l",
         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        default="INFO",
-        help="Set logging level (default: INFO)"
+        help="Set logging level (default: logging.level from config, else INFO)"
+    )
+
+    parser.add_argument(
+        "--debug-memory",
+        action="store_true",
+        help="Trace allocations and log the top memory growth periodically"
     )
 
     parser.add_argument(
@@ -69,7 +75,7 @@ def main() -> None:
     args = parser.parse_args()
 
     # Setup logging
-    setup_logging(args.log_level)
+    setup_logging(args.log_level or "INFO")
 
     # Handle commands
     if args.command == "validate":
@@ -78,7 +84,7 @@ def main() -> None:
         return generate_sample_config(args.output)
     else:
         # Default to start command
-        return start_service(args.config, args.log_level)
+        return start_service(args.config, args.log_level, args.debug_memory)
 
 
 def validate_config(config_path: str) -> None:
@@ -206,11 +212,11 @@ discord:
         sys.exit(1)
 
 
-def start_service(config_path: str, log_level: str) -> None:
+def start_service(config_path: str, log_level: Optional[str], debug_memory: bool = False) -> None:
     """Start the HTB Discord service."""
     try:
-        service = HTBDiscordService(config_path)
-        asyncio.run(service.start())
+        service = HTBDiscordService(config_path, debug_memory=debug_memory, log_level=log_level)
+        asyncio.run(service.run())
     except KeyboardInterrupt:
         print("\n🛑 Service interrupted by user")
         sys.exit(0)
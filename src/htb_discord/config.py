@@ -19,6 +19,7 @@ class Config:
     def __init__(self, config_path: str = "config.yaml"):
         self.config_path = Path(config_path)
         self._config: Dict[str, Any] = {}
+        self._feature_cache: Dict[str, bool] = {}
         self.load()
         self.validate()
 
@@ -34,6 +35,7 @@ class Config:
             # Substitute environment variables
             substituted_config = self._substitute_env_vars(raw_config)
             self._config = yaml.safe_load(substituted_config)
+            self._feature_cache.clear()
 
             logger.info(f"Configuration loaded from {self.config_path}")
 
@@ -137,8 +139,11 @@ class Config:
         return value
 
     def is_feature_enabled(self, feature: str) -> bool:
-        """Check if a feature is enabled."""
-        return self.get(f'features.{feature}.enabled', False)
+        """Check if a feature is enabled (cached until the next load)."""
+        enabled = self._feature_cache.get(feature)
+        if enabled is None:
+            enabled = self._feature_cache[feature] = self.get(f'features.{feature}.enabled', False)
+        return enabled
 
     def get_poll_interval(self, feature: str) -> int:
         """Get poll interval for a feature."""
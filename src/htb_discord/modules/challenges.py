@@ -63,6 +63,7 @@ class ChallengeMonitor:
         """Stop the challenge monitoring loop."""
         self.running = False
         logger.info("Stopping challenge monitor")
+        await self.osint_helper.close()
 
     async def fetch_challenges(self) -> List[Dict[str, Any]]:
         """Fetch unreleased challenges from HTB API."""
@@ -80,14 +81,17 @@ class ChallengeMonitor:
     async def check_new_challenges(self) -> None:
         """Check for new challenges and process them."""
         challenges = await self.fetch_challenges()
+        existing = await self.db_manager.existing_ids_async(
+            'challenges', 'tracked_challenges', (challenge['id'] for challenge in challenges)
+        )
 
         for challenge in challenges:
             challenge_id = challenge['id']
 
-            if not self.db_manager.challenge_exists(challenge_id):
+            if challenge_id not in existing:
                 logger.info(f"Found new challenge: {challenge['name']}")
                 await self.process_new_challenge(challenge)
-                self.db_manager.add_challenge(challenge)
+                await self.db_manager.add_challenge_async(challenge)
 
     async def process_new_challenge(self, challenge: Dict[str, Any]) -> None:
         """Process a new challenge by sending announcements, creating events, etc."""
@@ -30,6 +30,9 @@ class LinkwardenForwarder:
         self.links_per_batch = rate_limit_config.get('links_per_batch', 10)
         self.batch_interval = rate_limit_config.get('batch_interval', 6)
 
+        # Keyset position in the links table; failed links are retried on the next pass
+        self.last_link_id = 0
+
         # Collections cache
         self.collections_cache: Dict[str, Dict[str, Any]] = {}
 
@@ -56,17 +59,32 @@ class LinkwardenForwarder:
         await self.process_existing_messages()
 
         # Set up message listener
-        self.client.add_listener(self.on_message, 'on_message')
+        self._add_message_listener()
 
-        # Start link processing loop
-        asyncio.create_task(self.process_links_loop())
+        # Run link processing loop for the lifetime of the monitor task
+        await self.process_links_loop()
 
     async def stop(self) -> None:
         """Stop the Linkwarden forwarder."""
         self.running = False
-        self.client.remove_listener(self.on_message, 'on_message')
+        self._remove_message_listener()
         logger.info("Stopping Linkwarden forwarder")
 
+    def _add_message_listener(self) -> None:
+        """Listen for messages on either a Bot or a plain Client."""
+        if hasattr(self.client, 'add_listener'):
+            self.client.add_listener(self.on_message, 'on_message')
+        else:
+            # A plain Client dispatches events to its on_<event> attributes
+            self.client.on_message = self.on_message
+
+    def _remove_message_listener(self) -> None:
+        """Undo _add_message_listener."""
+        if hasattr(self.client, 'remove_listener'):
+            self.client.remove_listener(self.on_message, 'on_message')
+        elif getattr(self.client, 'on_message', None) == self.on_message:
+            del self.client.on_message
+
     async def process_existing_messages(self) -> None:
         """Process existing messages in monitored channels."""
         logger.info("Processing existing messages for links...")
@@ -85,7 +103,7 @@ class LinkwardenForwarder:
         """Process message history of a channel."""
         try:
             async for message in channel.history(limit=None):
-                self.extract_links_from_message(message)
+                await self.extract_links_from_message(message)
         except Exception as e:
             logger.error(f"Error processing channel history {channel.name}: {e}")
 
@@ -99,13 +117,13 @@ class LinkwardenForwarder:
             message.channel.category and
             str(message.channel.category.id) in self.categories_to_monitor):
 
-            self.extract_links_from_message(message)
+            await self.extract_links_from_message(message)
 
-    def extract_links_from_message(self, message: discord.Message) -> None:
+    async def extract_links_from_message(self, message: discord.Message) -> None:
         """Extract links from a message and save them."""
         links = re.findall(r'(https?://\S+)', message.content)
         for link in links:
-            self.db_manager.save_link(message.channel.name, link)
+            await self.db_manager.save_link_async(message.channel.name, link)
 
     async def process_links_loop(self) -> None:
         """Main loop for processing saved links."""
@@ -119,17 +137,21 @@ class LinkwardenForwarder:
 
     async def process_pending_links(self) -> None:
         """Process pending links from database."""
-        links = self.db_manager.get_unprocessed_links(self.links_per_batch)
+        links = await self.db_manager.get_unprocessed_links_after_async(self.last_link_id, self.links_per_batch)
 
         if not links:
+            # Reached the end of the table; start over to pick up links that failed
+            self.last_link_id = 0
             return
 
+        self.last_link_id = links[-1][0]
+
         logger.debug(f"Processing {len(links)} pending links")
 
         for link_id, channel_name, link in links:
             success = await self.send_link_to_linkwarden(channel_name, link)
             if success:
-                self.db_manager.mark_link_processed(link_id)
+                await self.db_manager.mark_link_processed_async(link_id)
                 logger.debug(f"Successfully processed link: {link}")
             else:
                 logger.warning(f"Failed to process link: {link}")
@@ -63,6 +63,7 @@ class MachineMonitor:
         """Stop the machine monitoring loop."""
         self.running = False
         logger.info("Stopping machine monitor")
+        await self.osint_helper.close()
 
     async def fetch_machines(self) -> List[Dict[str, Any]]:
         """Fetch unreleased machines from HTB API."""
@@ -80,14 +81,17 @@ class MachineMonitor:
     async def check_new_machines(self) -> None:
         """Check for new machines and process them."""
         machines = await self.fetch_machines()
+        existing = await self.db_manager.existing_ids_async(
+            'machines', 'tracked_machines', (machine['id'] for machine in machines)
+        )
 
         for machine in machines:
             machine_id = machine['id']
 
-            if not self.db_manager.machine_exists(machine_id):
+            if machine_id not in existing:
                 logger.info(f"Found new machine: {machine['name']}")
                 await self.process_new_machine(machine)
-                self.db_manager.add_machine(machine)
+                await self.db_manager.add_machine_async(machine)
 
     async def process_new_machine(self, machine: Dict[str, Any]) -> None:
         """Process a new machine by sending announcements, creating events, etc."""
@@ -160,7 +164,13 @@ class MachineMonitor:
             logger.warning("Machines voice channel ID not configured")
             return
 
-        voice_channel = await DiscordHelpers.resolve_channel(self.client, self.machines_voice_channel_id)
+        # Resolve the voice channel and download the machine image together
+        avatar_url = None
+        if machine.get('avatar'):
+            avatar_url = f"https://htb-mp-prod-public-storage.s3.eu-central-1.amazonaws.com{machine['avatar']}"
+        voice_channel, image_data = await DiscordHelpers.prepare_event_assets(
+            self.client, self.machines_voice_channel_id, avatar_url
+        )
         if not voice_channel or not isinstance(voice_channel, discord.VoiceChannel):
             logger.error(f"Invalid voice channel for events: {self.machines_voice_channel_id}")
             return
@@ -175,12 +185,6 @@ class MachineMonitor:
         start_time = datetime.fromisoformat(machine['release'].replace("Z", "+00:00")).astimezone(timezone.utc)
         end_time = start_time + timedelta(hours=2)
 
-        # Download machine image for event (preserve original data)
-        image_data = None
-        if machine.get('avatar'):
-            avatar_url = f"https://htb-mp-prod-public-storage.s3.eu-central-1.amazonaws.com{machine['avatar']}"
-            image_data = await DiscordHelpers.download_image(avatar_url, for_event=True)
-
         # Create event
         success = await DiscordHelpers.create_scheduled_event(
             guild=voice_channel.guild,
@@ -68,13 +68,16 @@ class NoticeMonitor:
     async def check_new_notices(self) -> None:
         """Check for new notices and process them."""
         notices = await self.fetch_notices()
+        existing = await self.db_manager.existing_ids_async(
+            'notices', 'sent_notices', (notice["id"] for notice in notices if notice.get("id"))
+        )
 
         for notice in notices:
             notice_id = notice.get("id")
-            if notice_id and not self.db_manager.notice_exists(notice_id):
+            if notice_id and notice_id not in existing:
                 logger.info(f"Found new notice: {notice_id}")
                 await self.process_new_notice(notice)
-                self.db_manager.add_notice(notice_id)
+                await self.db_manager.add_notice_async(notice_id)
 
     async def process_new_notice(self, notice: Dict[str, Any]) -> None:
         """Process a new notice by sending it to Discord."""
@@ -1,53 +1,466 @@
 """OSINT module for automatic machine information gathering."""
 
 import asyncio
+import hashlib
+import json
 import logging
-import requests
-from urllib.parse import urlparse
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Awaitable, List, Optional, Tuple, TypeVar
 
+import aiohttp
 import discord
 from discord.ext import commands
 
+from ..config import Config
+from ..utils.cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+HTB_API_URL = "https://labs.hackthebox.com/api/v4/"
+
+# HTB profile data changes rarely; cache lookups for repeated OSINT posts
+CACHE_MAXSIZE = 1024
+CACHE_TTL = 900  # seconds
+
+# Validators and bodies kept for conditional requests once the TTL caches expire
+CONDITIONAL_CACHE_TTL = 86400  # seconds
+
+# Lookups that 404 or return no data are not retried within this window
+NEGATIVE_CACHE_TTL = 60  # seconds
+
+# Maximum number of concurrent detail requests per maker
+DETAIL_CONCURRENCY = 8
+
+# Makers with more content items than this are rendered off the event loop
+RENDER_OFFLOAD_THRESHOLD = 200
+
+# Base URLs for relative avatar paths returned by the HTB API
+MACHINE_AVATAR_BASE_URL = "https://htb-mp-prod-public-storage.s3.eu-central-1.amazonaws.com"
+USER_AVATAR_BASE_URL = "https://account.hackthebox.com"
+
+# Link prefixes for rendered content lists
+MACHINE_LINK_PREFIX = "https://app.hackthebox.com/machines/"
+CHALLENGE_LINK_PREFIX = "https://app.hackthebox.com/challenges/"
+
+_URL_SCHEMES = ("http://", "https://")
+
+# Maker profile embed fields as (field name, profile key)
+PROFILE_FIELDS = (
+    ("System Owns", "system_owns"),
+    ("User Owns", "user_owns"),
+    ("Respects", "respects"),
+    ("Rank", "rank"),
+    ("Ranking", "ranking"),
+    ("Country", "country_name"),
+    ("Time Zone", "timezone"),
+)
+
+# Built maker profile embeds keyed by a digest of the profile payload
+_profile_embed_cache = TTLCache(maxsize=256, ttl=CACHE_TTL)
+
+
+def build_headers(config: Config) -> Dict[str, str]:
+    """Build HTB API request headers from configuration."""
+    return {
+        "Authorization": f"Bearer {config.get('api.htb_bearer_token')}",
+        "Accept": "application/json",
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/117.0.0.0 Safari/537.36 Edg/117.0.2045.55"
+        ),
+    }
+
+
+def is_valid_url(url: str) -> bool:
+    """Check if URL is an absolute http(s) URL with a dotted host."""
+    return bool(url) and url.startswith(_URL_SCHEMES) and "." in url
+
+
+def _split_content(content: str, max_length: int = 1024) -> List[str]:
+    """Split content into chunks that fit in embed fields."""
+    chunks: List[str] = []
+    buf: List[str] = []
+    size = 0
+    for line in content.split("\n"):
+        line_length = len(line) + 1
+        if size + line_length > max_length and buf:
+            chunks.append("".join(buf))
+            buf, size = [], 0
+        buf.append(line)
+        buf.append("\n")
+        size += line_length
+    if buf:
+        chunks.append("".join(buf))
+    return chunks
+
+
+def _chunk_fields(name: str, content: str) -> List[Tuple[str, str]]:
+    """Split content into one or more numbered (name, value) embed fields."""
+    return [
+        (f"{name} (Part {i + 1})" if i > 0 else name, chunk)
+        for i, chunk in enumerate(_split_content(content))
+    ]
+
+
+def _build_machine_embed(machine_data: Dict[str, Any], title: str = "🔍 Machine Details") -> discord.Embed:
+    """Build the machine information embed."""
+    difficulty = machine_data.get("difficultyText", "Unknown")
+    os_type = machine_data.get("os", "Unknown")
+    creator1 = machine_data.get("maker", {})
+    creator2 = machine_data.get("maker2", {})
+
+    # Handle avatar
+    avatar_path = machine_data.get("avatar", "")
+    machine_thumbnail = None
+    if avatar_path:
+        avatar_path = avatar_path.strip()
+        avatar_url = (avatar_path if avatar_path.startswith("http")
+                     else MACHINE_AVATAR_BASE_URL + avatar_path)
+        if is_valid_url(avatar_url):
+            machine_thumbnail = avatar_url
+
+    # Create embed
+    embed = discord.Embed(
+        title=f"{title}: {machine_data.get('name', 'Unknown')}",
+        description=f"**Difficulty:** {difficulty}\n**OS:** {os_type}",
+        color=discord.Color.blue()
+    )
+
+    if machine_thumbnail:
+        embed.set_thumbnail(url=machine_thumbnail)
+
+    # Add creator information
+    for label, creator in (("Maker 1", creator1), ("Maker 2", creator2)):
+        if creator:
+            profile_url = f"https://app.hackthebox.com/profile/{creator.get('id')}"
+            embed.add_field(
+                name=label,
+                value=f"[{creator.get('name', 'Unknown')}]({profile_url})",
+                inline=False
+            )
+            embed.add_field(name=f"{label} ID", value=creator.get("id", "Unknown"), inline=True)
+
+    return embed
+
+
+def _build_maker_profile_embed(profile_data: Dict[str, Any], title: str = "👤 Maker Profile") -> discord.Embed:
+    """Build the maker profile embed."""
+    # Handle avatar
+    avatar_path = profile_data.get("avatar", "")
+    user_thumbnail = None
+    if avatar_path:
+        avatar_path = avatar_path.strip()
+        if avatar_path.startswith("/"):
+            avatar_url = USER_AVATAR_BASE_URL + avatar_path
+        elif avatar_path.startswith("http"):
+            avatar_url = avatar_path
+        else:
+            avatar_url = None
+
+        if avatar_url and is_valid_url(avatar_url):
+            user_thumbnail = avatar_url
+
+    # Add profile fields
+    fields = [
+        {"name": name, "value": str(profile_data.get(key, "N/A")), "inline": True}
+        for name, key in PROFILE_FIELDS
+    ]
+
+    # Add team info
+    team = profile_data.get("team", {})
+    if team:
+        team_profile_url = f"https://app.hackthebox.com/team/{team.get('id')}"
+        fields.append({"name": "Team", "value": f"[{team.get('name')}]({team_profile_url})", "inline": True})
+        fields.append({"name": "Team Ranking", "value": str(team.get("ranking", "N/A")), "inline": True})
+
+    # Add social links
+    for social in ['github', 'linkedin', 'twitter']:
+        if profile_data.get(social):
+            fields.append({
+                "name": social.capitalize(),
+                "value": f"[{social.capitalize()}]({profile_data.get(social)})",
+                "inline": False
+            })
+
+    payload = {
+        "title": f"{title}: {profile_data.get('name', 'Unknown')}",
+        "color": discord.Color.gold().value,
+        "fields": fields,
+    }
+    if user_thumbnail:
+        payload["thumbnail"] = {"url": user_thumbnail}
+
+    return discord.Embed.from_dict(payload)
+
+
+def _maker_profile_embed(profile_data: Dict[str, Any], title: str = "👤 Maker Profile") -> discord.Embed:
+    """Get a maker profile embed, reusing the build for identical profile data."""
+    key = (title, hashlib.sha1(json.dumps(profile_data, sort_keys=True, default=str).encode()).digest())
+    embed = _profile_embed_cache.get(key)
+    if embed is None:
+        embed = _build_maker_profile_embed(profile_data, title)
+        _profile_embed_cache.set(key, embed)
+
+    # Hand out a copy so callers cannot mutate the cached embed
+    return embed.copy()
+
+
+def _render_machine_list(machines: List[Dict[str, Any]], skip_machine_id: Optional[int],
+                         machine_details: Dict[int, Dict[str, Any]]) -> str:
+    """Render a maker's machines, best rated first, with first blood info."""
+    # Sort machines by rating first, then by ID (most recent); missing values sort as 0
+    machines = sorted(
+        machines, key=lambda machine: (machine.get('rating') or 0, machine.get('id') or 0), reverse=True
+    )
+
+    machine_parts: List[str] = []
+    for machine in machines:
+        machine_id = machine.get('id')
+        if skip_machine_id and machine_id == skip_machine_id:
+            continue
+
+        first_blood_info = ""
+        details = machine_details.get(machine_id)
+        if details:
+            user_blood = details.get('userBlood')
+            root_blood = details.get('rootBlood')
+
+            if user_blood and root_blood:
+                first_blood_info = f" | 🩸 {user_blood['user']['name']}/{root_blood['user']['name']}"
+            elif user_blood:
+                first_blood_info = f" | 🩸 {user_blood['user']['name']}"
+
+        name, os_type, difficulty = machine['name'], machine['os'], machine['difficulty']
+        rating, user_owns, system_owns = machine['rating'], machine['user_owns'], machine['system_owns']
+        machine_parts.append(
+            f"- **[{name}]({MACHINE_LINK_PREFIX}{machine_id})** ({os_type} | {difficulty} | ⭐{rating}/5 | "
+            f"👤{user_owns} | 🔐{system_owns}{first_blood_info})\n"
+        )
+
+    return "".join(machine_parts)
+
+
+def _render_writeup_list(writeups: List[Dict[str, Any]]) -> str:
+    """Render a maker's writeups."""
+    return "".join(
+        f"- **{writeup['machine_name']}** (Type: {writeup['type']})\n"
+        f"  URL: {writeup['url']}\n"
+        for writeup in writeups
+    )
+
+
+def _render_challenge_list(challenges: List[Dict[str, Any]],
+                           challenge_details: Dict[Any, Dict[str, Any]]) -> str:
+    """Render a maker's challenges with difficulty, solves and first blood info."""
+    challenge_parts: List[str] = []
+    for challenge in challenges:
+        # Safely get challenge fields with fallbacks
+        get = challenge.get
+        challenge_name = get('name', 'Unknown')
+        challenge_category = get('category', get('category_name', 'Unknown'))
+        challenge_rating = get('rating', 'N/A')
+        challenge_id = get('id', '')
+
+        difficulty_text = "Unknown"
+        bloods_info = ""
+        solve_count = ""
+
+        detailed_info = challenge_details.get(challenge_id)
+        if detailed_info:
+            difficulty_text = detailed_info.get('difficulty', 'Unknown')
+            solves = detailed_info.get('solves', 0)
+            if solves > 0:
+                solve_count = f" | 👤{solves}"
+
+            # Get first blood info
+            first_blood_user = detailed_info.get('first_blood_user')
+            if first_blood_user:
+                bloods_info = f" | 🩸 {first_blood_user}"
+
+        # Create enhanced challenge entry with difficulty, rating, and bloods
+        challenge_parts.append(
+            f"- **[{challenge_name}]({CHALLENGE_LINK_PREFIX}{challenge_id})** "
+            f"({challenge_category} | {difficulty_text} | ⭐{challenge_rating}{solve_count}{bloods_info})\n"
+        )
+
+    return "".join(challenge_parts)
+
+
+def _render_content_fields(content_data: Dict[str, Any], skip_machine_id: Optional[int],
+                           machine_details: Dict[int, Dict[str, Any]],
+                           challenge_details: Dict[Any, Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """Render all maker content sections into (name, value) embed fields."""
+    fields = []
+
+    # Add machines (show all machines, no limits)
+    if content_data.get("machines"):
+        machine_list = _render_machine_list(content_data["machines"], skip_machine_id, machine_details)
+        if machine_list:
+            fields.extend(_chunk_fields("Created Machines", machine_list))
+
+    # Add writeups
+    if content_data.get("writeups"):
+        writeup_list = _render_writeup_list(content_data["writeups"])
+        if writeup_list:
+            fields.extend(_chunk_fields("Created Writeups", writeup_list))
+
+    # Add challenges
+    if content_data.get("challenges"):
+        challenge_list = _render_challenge_list(content_data["challenges"], challenge_details)
+        if challenge_list:
+            fields.extend(_chunk_fields("Created Challenges", challenge_list))
+
+    return fields
+
+
+def _build_maker_content_embed(username: str, fields: List[Tuple[str, str]],
+                               title: str = "📊 Content Created by") -> discord.Embed:
+    """Build the maker content embed from rendered fields."""
+    payload = {
+        "title": f"{title} {username}",
+        "color": discord.Color.blue().value,
+        "fields": [{"name": name, "value": value, "inline": False} for name, value in fields],
+    }
+
+    # Handle empty content
+    if not fields:
+        payload["description"] = "No content created by this user."
+
+    return discord.Embed.from_dict(payload)
+
+
 class OSINTHelper:
     """Helper class for automatic OSINT information gathering."""
 
     def __init__(self, config):
         self.config = config
-        self.headers = {
-            "Authorization": f"Bearer {config.get('api.htb_bearer_token')}",
-            "Accept": "application/json",
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/117.0.0.0 Safari/537.36 Edg/117.0.2045.55"
-            ),
-        }
+        self.headers = build_headers(config)
 
-    @staticmethod
-    def is_valid_url(url: str) -> bool:
-        """Check if URL is valid."""
-        if not url:
-            return False
-        url = url.strip()
-        parsed = urlparse(url)
-        return parsed.scheme in ("http", "https") and bool(parsed.netloc)
+        # Response caches keyed by maker ID, machine name and challenge ID
+        self._maker_cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+        self._machine_cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+        self._challenge_details_cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
 
-    async def gather_machine_info(self, machine_name: str) -> Optional[Dict[str, Any]]:
-        """Gather comprehensive OSINT information for a machine."""
-        api_url = f"https://labs.hackthebox.com/api/v4/machine/profile/{machine_name}"
+        # Machine names / challenge IDs known not to exist
+        self._negative = TTLCache(maxsize=256, ttl=NEGATIVE_CACHE_TTL)
+
+        # URL -> (ETag, Last-Modified, parsed body) for conditional GETs
+        self._conditional_cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CONDITIONAL_CACHE_TTL)
+
+        # Machine profile requests currently in flight, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Future] = {}
 
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, use_dns_cache=True),
+                timeout=aiohttp.ClientTimeout(total=15)
+            )
+        return self._session
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection to the HTB API ahead of the first lookup."""
         try:
-            machine_response = requests.get(api_url, headers=self.headers)
-            if machine_response.status_code != 200:
-                logger.error(f"Failed to fetch machine '{machine_name}'. Error: {machine_response.status_code}")
-                return None
+            session = await self._get_session()
+            async with session.head(HTB_API_URL):
+                pass
+            logger.debug("HTB API connection pool warmed up")
+        except Exception as e:
+            logger.debug(f"HTB API warm-up request failed: {e}")
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    async def _get_json(self, url: str) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """GET a URL and return the status code and decoded JSON body (None unless 200).
+
+        Responses carrying an ETag or Last-Modified header are remembered and
+        revalidated on the next request; a 304 reuses the previously parsed body.
+        """
+        session = await self._get_session()
+
+        headers = {}
+        cached = self._conditional_cache.get(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached:
+                return 200, cached[2]
+            if response.status != 200:
+                return response.status, None
+
+            body = await response.json(content_type=None)
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self._conditional_cache.set(url, (etag, last_modified, body))
+
+            return response.status, body
+
+    async def fetch_machine_profile(self, machine_name: str) -> Optional[Dict[str, Any]]:
+        """Fetch the raw machine profile, reusing cached or in-flight requests."""
+        _, machine_data = await self.fetch_machine_profile_status(machine_name)
+        return machine_data
+
+    async def fetch_machine_profile_status(self, machine_name: str) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Fetch the raw machine profile along with the HTTP status of the lookup."""
+        cached = self._machine_cache.get(machine_name)
+        if cached is not None:
+            return 200, cached
+
+        negative_status = self._negative.get(('machine', machine_name))
+        if negative_status is not None:
+            return negative_status, None
+
+        inflight = self._inflight.get(machine_name)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch_machine_profile(machine_name))
+            self._inflight[machine_name] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(machine_name, None))
+
+        # Shield so one cancelled caller does not cancel the request for the others
+        return await asyncio.shield(inflight)
+
+    async def _fetch_machine_profile(self, machine_name: str) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Fetch the raw machine profile from the HTB API."""
+        api_url = f"https://labs.hackthebox.com/api/v4/machine/profile/{machine_name}"
+
+        status, body = await self._get_json(api_url)
+        if body is None:
+            logger.error(f"Failed to fetch machine '{machine_name}'. Error: {status}")
+            if status == 404:
+                self._negative.set(('machine', machine_name), status)
+            return status, None
+
+        machine_data = body.get("info", {})
+        if not machine_data:
+            logger.warning(f"Machine '{machine_name}' not found or no data returned.")
+            self._negative.set(('machine', machine_name), status)
+            return status, None
 
-            machine_data = machine_response.json().get("info", {})
+        self._machine_cache.set(machine_name, machine_data)
+        return status, machine_data
+
+    async def gather_machine_info(self, machine_name: str) -> Optional[Dict[str, Any]]:
+        """Gather comprehensive OSINT information for a machine."""
+        try:
+            machine_data = await self.fetch_machine_profile(machine_name)
             if not machine_data:
-                logger.warning(f"Machine '{machine_name}' not found or no data returned.")
                 return None
 
             # Gather maker information
@@ -70,45 +483,53 @@ class OSINTHelper:
 
     async def gather_maker_info(self, maker_id: int, skip_machine_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """Gather maker profile and content information."""
+        try:
+            _, maker_info = await self.fetch_maker_info(maker_id, skip_machine_id)
+            return maker_info
+
+        except Exception as e:
+            logger.error(f"Error gathering maker info for ID {maker_id}: {e}")
+            return None
+
+    async def fetch_maker_info(self, maker_id: int, skip_machine_id: Optional[int] = None
+                               ) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Fetch maker profile and content along with the HTTP status of the profile lookup."""
+        cached = self._maker_cache.get(maker_id)
+        if cached is not None:
+            return 200, {**cached, 'skip_machine_id': skip_machine_id}
+
         profile_url = f"https://labs.hackthebox.com/api/v4/user/profile/basic/{maker_id}"
         content_url = f"https://labs.hackthebox.com/api/v4/user/profile/content/{maker_id}"
 
-        try:
-            # Fetch profile data
-            profile_response = requests.get(profile_url, headers=self.headers)
-            if profile_response.status_code != 200:
-                logger.error(f"Failed to fetch profile for Maker ID {maker_id}. Error: {profile_response.status_code}")
-                return None
+        # Fetch profile and content data concurrently
+        (profile_status, profile_body), (_, content_body) = await asyncio.gather(
+            self._get_json(profile_url),
+            self._get_json(content_url)
+        )
+        if profile_body is None:
+            logger.error(f"Failed to fetch profile for Maker ID {maker_id}. Error: {profile_status}")
+            return profile_status, None
 
-            profile_data = profile_response.json().get("profile", {})
+        profile_data = profile_body.get("profile", {})
 
-            # Fetch content data
-            content_response = requests.get(content_url, headers=self.headers)
-            content_data = {}
-            if content_response.status_code == 200:
-                content_data = content_response.json().get("profile", {}).get("content", {})
+        content_data = {}
+        if content_body is not None:
+            content_data = content_body.get("profile", {}).get("content", {})
 
-            return {
-                'profile': profile_data,
-                'content': content_data,
-                'skip_machine_id': skip_machine_id
-            }
+        # Don't pin a missing content list for the full TTL; retry it soon
+        ttl = None if content_body is not None else NEGATIVE_CACHE_TTL
+        self._maker_cache.set(maker_id, {'profile': profile_data, 'content': content_data}, ttl=ttl)
 
-        except Exception as e:
-            logger.error(f"Error gathering maker info for ID {maker_id}: {e}")
-            return None
+        return profile_status, {
+            'profile': profile_data,
+            'content': content_data,
+            'skip_machine_id': skip_machine_id
+        }
 
     async def get_machine_details(self, machine_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed machine information including first bloods."""
-        api_url = f"https://labs.hackthebox.com/api/v4/machine/profile/{machine_name}"
-
         try:
-            response = requests.get(api_url, headers=self.headers)
-            if response.status_code != 200:
-                logger.warning(f"Failed to fetch machine details for '{machine_name}'. Status: {response.status_code}")
-                return None
-
-            machine_data = response.json().get("info", {})
+            machine_data = await self.fetch_machine_profile(machine_name)
             if not machine_data:
                 return None
 
@@ -128,28 +549,85 @@ class OSINTHelper:
 
     async def get_challenge_details(self, challenge_id: int) -> Optional[Dict[str, Any]]:
         """Get detailed challenge information including difficulty and bloods."""
+        cached = self._challenge_details_cache.get(challenge_id)
+        if cached is not None:
+            return cached
+
+        if ('challenge', challenge_id) in self._negative:
+            return None
+
         try:
             detail_url = f"https://labs.hackthebox.com/api/v4/challenge/info/{challenge_id}"
-            response = requests.get(detail_url, headers=self.headers)
+            status, detail_data = await self._get_json(detail_url)
 
-            if response.status_code == 200:
-                detail_data = response.json()
+            if detail_data is not None:
                 challenge_data = detail_data.get('challenge', {})
 
-
-                return {
+                details = {
                     'difficulty': challenge_data.get('difficulty', 'Unknown'),
                     'solves': challenge_data.get('solves', 0),
                     'first_blood_user': challenge_data.get('first_blood_user')
                 }
+                self._challenge_details_cache.set(challenge_id, details)
+                return details
             else:
-                logger.warning(f"Failed to fetch challenge details for ID {challenge_id}: {response.status_code}")
+                logger.warning(f"Failed to fetch challenge details for ID {challenge_id}: {status}")
+                if status == 404:
+                    self._negative.set(('challenge', challenge_id), True)
                 return None
 
         except Exception as e:
             logger.warning(f"Error fetching challenge details for ID {challenge_id}: {e}")
             return None
 
+    async def _limited(self, coro: Awaitable[T]) -> T:
+        """Await a coroutine while holding the detail request semaphore."""
+        async with self._semaphore:
+            return await coro
+
+    async def get_first_bloods_bulk(self, machines: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """Fetch machine details for many machines concurrently, keyed by machine ID."""
+        results = await asyncio.gather(
+            *(self._limited(self.get_machine_details(machine['name'])) for machine in machines)
+        )
+        return {
+            machine.get("id"): details
+            for machine, details in zip(machines, results, strict=True)
+            if details
+        }
+
+    async def get_challenge_details_bulk(self, challenges: List[Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+        """Fetch challenge details for many challenges concurrently, keyed by challenge ID."""
+        challenge_ids = [challenge.get('id', '') for challenge in challenges]
+        results = await asyncio.gather(
+            *(self._limited(self.get_challenge_details(challenge_id)) for challenge_id in challenge_ids)
+        )
+        return {
+            challenge_id: details
+            for challenge_id, details in zip(challenge_ids, results, strict=True)
+            if details
+        }
+
+    async def fetch_content_details(self, content_data: Dict[str, Any],
+                                    skip_machine_id: Optional[int] = None
+                                    ) -> Tuple[Dict[int, Dict[str, Any]], Dict[Any, Dict[str, Any]]]:
+        """Fetch first blood and difficulty details for a maker's machines and challenges."""
+        machines = [
+            machine for machine in content_data.get("machines") or []
+            if not (skip_machine_id and machine.get("id") == skip_machine_id)
+        ]
+        challenges = content_data.get("challenges") or []
+
+        return await asyncio.gather(
+            self.get_first_bloods_bulk(machines),
+            self.get_challenge_details_bulk(challenges)
+        )
+
+    @staticmethod
+    async def _send(destination: discord.abc.Messageable, embed: discord.Embed) -> None:
+        """Send an embed to a channel, thread or command context."""
+        await destination.send(embed=embed)
+
     async def post_osint_to_thread(self, thread: discord.Thread, machine_name: str) -> bool:
         """Post OSINT information to a forum thread."""
         try:
@@ -158,12 +636,16 @@ class OSINTHelper:
                 logger.warning(f"No OSINT data found for machine: {machine_name}")
                 return False
 
-            # Post machine information
-            await self.post_machine_info(thread, osint_data['machine'])
+            # Post machine information while maker content details are fetched
+            _, maker_embeds = await asyncio.gather(
+                self.post_machine_info(thread, osint_data['machine']),
+                asyncio.gather(*(self.build_maker_embeds(maker_info) for maker_info in osint_data['makers']))
+            )
 
-            # Post maker information
-            for maker_info in osint_data['makers']:
-                await self.post_maker_info(thread, maker_info)
+            # Post maker information in order once the machine embed is out
+            for embeds in maker_embeds:
+                for embed in embeds:
+                    await self._send(thread, embed)
 
             logger.info(f"Posted OSINT information for {machine_name} to thread {thread.name}")
             return True
@@ -172,293 +654,78 @@ class OSINTHelper:
             logger.error(f"Failed to post OSINT info for {machine_name}: {e}")
             return False
 
-    async def post_machine_info(self, thread: discord.Thread, machine_data: Dict[str, Any]) -> None:
-        """Post machine information to thread."""
-        difficulty = machine_data.get("difficultyText", "Unknown")
-        os_type = machine_data.get("os", "Unknown")
-        creator1 = machine_data.get("maker", {})
-        creator2 = machine_data.get("maker2", {})
-
-        # Handle avatar
-        avatar_path = machine_data.get("avatar", "")
-        machine_thumbnail = None
-        if avatar_path:
-            avatar_path = avatar_path.strip()
-            avatar_url = (avatar_path if avatar_path.startswith("http")
-                         else f"https://htb-mp-prod-public-storage.s3.eu-central-1.amazonaws.com{avatar_path}")
-            if self.is_valid_url(avatar_url):
-                machine_thumbnail = avatar_url
-
-        # Create embed
-        embed = discord.Embed(
-            title=f"🔍 Machine Details: {machine_data.get('name', 'Unknown')}",
-            description=f"**Difficulty:** {difficulty}\n**OS:** {os_type}",
-            color=discord.Color.blue()
-        )
-
-        if machine_thumbnail:
-            embed.set_thumbnail(url=machine_thumbnail)
-
-        # Add creator information
-        if creator1:
-            profile_url = f"https://app.hackthebox.com/profile/{creator1.get('id')}"
-            embed.add_field(
-                name="Maker 1",
-                value=f"[{creator1.get('name', 'Unknown')}]({profile_url})",
-                inline=False
-            )
-            embed.add_field(name="Maker 1 ID", value=creator1.get("id", "Unknown"), inline=True)
-
-        if creator2:
-            profile_url = f"https://app.hackthebox.com/profile/{creator2.get('id')}"
-            embed.add_field(
-                name="Maker 2",
-                value=f"[{creator2.get('name', 'Unknown')}]({profile_url})",
-                inline=False
-            )
-            embed.add_field(name="Maker 2 ID", value=creator2.get("id", "Unknown"), inline=True)
-
-        await thread.send(embed=embed)
+    async def post_machine_info(self, destination: discord.abc.Messageable, machine_data: Dict[str, Any]) -> None:
+        """Post machine information embed."""
+        await self._send(destination, _build_machine_embed(machine_data))
 
-    async def post_maker_info(self, thread: discord.Thread, maker_info: Dict[str, Any]) -> None:
-        """Post maker profile and content information to thread."""
+    async def build_maker_embeds(self, maker_info: Dict[str, Any]) -> Tuple[discord.Embed, discord.Embed]:
+        """Build the maker profile and content embeds, fetching content details as needed."""
         profile_data = maker_info['profile']
         content_data = maker_info['content']
         skip_machine_id = maker_info.get('skip_machine_id')
 
-        # Post profile information
-        await self.post_maker_profile(thread, profile_data)
-
-        # Post content information
-        await self.post_maker_content(thread, content_data, profile_data.get("name", "Unknown"), skip_machine_id)
-
-    async def post_maker_profile(self, thread: discord.Thread, profile_data: Dict[str, Any]) -> None:
-        """Post maker profile embed to thread."""
-        # Handle avatar
-        avatar_path = profile_data.get("avatar", "")
-        user_thumbnail = None
-        if avatar_path:
-            avatar_path = avatar_path.strip()
-            if avatar_path.startswith("/"):
-                avatar_url = f"https://account.hackthebox.com{avatar_path}"
-            elif avatar_path.startswith("http"):
-                avatar_url = avatar_path
-            else:
-                avatar_url = None
+        content_embed = await self.build_content_embed(content_data, profile_data.get("name", "Unknown"),
+                                                       skip_machine_id)
+        return _maker_profile_embed(profile_data), content_embed
 
-            if avatar_url and self.is_valid_url(avatar_url):
-                user_thumbnail = avatar_url
+    async def build_content_embed(self, content_data: Dict[str, Any], username: str,
+                                  skip_machine_id: Optional[int] = None) -> discord.Embed:
+        """Fetch content details and build the maker content embed."""
+        machine_details, challenge_details = await self.fetch_content_details(content_data, skip_machine_id)
 
-        # Create embed
-        embed = discord.Embed(
-            title=f"👤 Maker Profile: {profile_data.get('name', 'Unknown')}",
-            color=discord.Color.gold()
-        )
+        # Rendering hundreds of rows is pure CPU work; keep it off the event loop
+        item_count = sum(len(content_data.get(key) or []) for key in ("machines", "writeups", "challenges"))
+        render_args = (content_data, skip_machine_id, machine_details, challenge_details)
+        if item_count > RENDER_OFFLOAD_THRESHOLD:
+            fields = await asyncio.to_thread(_render_content_fields, *render_args)
+        else:
+            fields = _render_content_fields(*render_args)
 
-        if user_thumbnail:
-            embed.set_thumbnail(url=user_thumbnail)
-
-        # Add profile fields
-        embed.add_field(name="System Owns", value=profile_data.get("system_owns", "N/A"), inline=True)
-        embed.add_field(name="User Owns", value=profile_data.get("user_owns", "N/A"), inline=True)
-        embed.add_field(name="Respects", value=profile_data.get("respects", "N/A"), inline=True)
-        embed.add_field(name="Rank", value=profile_data.get("rank", "N/A"), inline=True)
-        embed.add_field(name="Ranking", value=profile_data.get("ranking", "N/A"), inline=True)
-        embed.add_field(name="Country", value=profile_data.get("country_name", "N/A"), inline=True)
-        embed.add_field(name="Time Zone", value=profile_data.get("timezone", "N/A"), inline=True)
-
-        # Add team info
-        team = profile_data.get("team", {})
-        if team:
-            team_profile_url = f"https://app.hackthebox.com/team/{team.get('id')}"
-            embed.add_field(
-                name="Team",
-                value=f"[{team.get('name')}]({team_profile_url})",
-                inline=True
-            )
-            embed.add_field(name="Team Ranking", value=team.get("ranking", "N/A"), inline=True)
-
-        # Add social links
-        for social in ['github', 'linkedin', 'twitter']:
-            if profile_data.get(social):
-                embed.add_field(
-                    name=social.capitalize(),
-                    value=f"[{social.capitalize()}]({profile_data.get(social)})",
-                    inline=False
-                )
-
-        await thread.send(embed=embed)
-
-    async def post_maker_content(self, thread: discord.Thread, content_data: Dict[str, Any],
-                                username: str, skip_machine_id: Optional[int] = None) -> None:
-        """Post maker content information to thread."""
-        embed = discord.Embed(
-            title=f"📊 Content Created by {username}",
-            color=discord.Color.blue()
-        )
+        return _build_maker_content_embed(username, fields)
+
+    async def post_maker_info(self, destination: discord.abc.Messageable, maker_info: Dict[str, Any]) -> None:
+        """Post maker profile and content information."""
+        profile_embed, content_embed = await self.build_maker_embeds(maker_info)
+        await self._send(destination, profile_embed)
+        await self._send(destination, content_embed)
 
-        def split_content(content: str, max_length: int = 1024) -> list:
-            """Split content into chunks that fit in embed fields."""
-            lines = content.split("\n")
-            chunks, current_chunk = [], ""
-            for line in lines:
-                if len(current_chunk) + len(line) + 1 > max_length:
-                    chunks.append(current_chunk)
-                    current_chunk = line + "\n"
-                else:
-                    current_chunk += line + "\n"
-            if current_chunk:
-                chunks.append(current_chunk)
-            return chunks
-
-        # Add machines (show all machines, no limits)
-        if content_data.get("machines"):
-            # Sort machines by rating first, then by ID (most recent)
-            machines = sorted(content_data["machines"], key=lambda x: (x.get('rating', 0), x.get('id', 0)), reverse=True)
-
-            machine_list = ""
-            machine_count = 0
-
-            for machine in machines:
-                if skip_machine_id and machine.get("id") == skip_machine_id:
-                    continue
-
-                machine_count += 1
-                # Get first blood info for all machines (with rate limit handling)
-                first_blood_info = ""
-                machine_details = await self.get_machine_details(machine['name'])
-                if machine_details:
-                    user_blood = machine_details.get('userBlood')
-                    root_blood = machine_details.get('rootBlood')
-
-                    if user_blood and root_blood:
-                        first_blood_info = f" | 🩸 {user_blood['user']['name']}/{root_blood['user']['name']}"
-                    elif user_blood:
-                        first_blood_info = f" | 🩸 {user_blood['user']['name']}"
-
-                # Add small delay to avoid rate limiting
-                await asyncio.sleep(0.2)
-
-                machine_list += (
-                    f"- **[{machine['name']}]"
-                    f"(https://app.hackthebox.com/machines/{machine['id']})** "
-                    f"({machine['os']} | {machine['difficulty']} | ⭐{machine['rating']}/5 | "
-                    f"👤{machine['user_owns']} | 🔐{machine['system_owns']}{first_blood_info})\n"
-                )
-
-            if machine_list:
-                for i, chunk in enumerate(split_content(machine_list)):
-                    embed.add_field(
-                        name=f"Created Machines (Part {i + 1})" if i > 0 else "Created Machines",
-                        value=chunk,
-                        inline=False
-                    )
-
-        # Add writeups
-        if content_data.get("writeups"):
-            writeup_list = ""
-            for writeup in content_data["writeups"]:
-                writeup_list += (
-                    f"- **{writeup['machine_name']}** (Type: {writeup['type']})\n"
-                    f"  URL: {writeup['url']}\n"
-                )
-
-            if writeup_list:
-                for i, chunk in enumerate(split_content(writeup_list)):
-                    embed.add_field(
-                        name=f"Created Writeups (Part {i + 1})" if i > 0 else "Created Writeups",
-                        value=chunk,
-                        inline=False
-                    )
-
-        # Add challenges
-        if content_data.get("challenges"):
-            challenge_list = ""
-            for challenge in content_data["challenges"]:
-                # Safely get challenge fields with fallbacks
-                challenge_name = challenge.get('name', 'Unknown')
-                challenge_category = challenge.get('category', challenge.get('category_name', 'Unknown'))
-                challenge_rating = challenge.get('rating', 'N/A')
-                challenge_id = challenge.get('id', '')
-
-                # Get detailed challenge info for difficulty and bloods
-                detailed_info = await self.get_challenge_details(challenge_id)
-                difficulty_text = "Unknown"
-                bloods_info = ""
-                solve_count = ""
-
-                if detailed_info:
-                    difficulty_text = detailed_info.get('difficulty', 'Unknown')
-                    solves = detailed_info.get('solves', 0)
-                    if solves > 0:
-                        solve_count = f" | 👤{solves}"
-
-                    # Get first blood info
-                    first_blood_user = detailed_info.get('first_blood_user')
-                    if first_blood_user:
-                        bloods_info = f" | 🩸 {first_blood_user}"
-
-
-                # Add small delay to avoid rate limiting
-                await asyncio.sleep(0.1)
-
-                # Create enhanced challenge entry with difficulty, rating, and bloods
-                challenge_list += (
-                    f"- **[{challenge_name}](https://app.hackthebox.com/challenges/{challenge_id})** "
-                    f"({challenge_category} | {difficulty_text} | ⭐{challenge_rating}{solve_count}{bloods_info})\n"
-                )
-
-            if challenge_list:
-                for i, chunk in enumerate(split_content(challenge_list)):
-                    embed.add_field(
-                        name=f"Created Challenges (Part {i + 1})" if i > 0 else "Created Challenges",
-                        value=chunk,
-                        inline=False
-                    )
-
-        # Handle empty content
-        if not embed.fields:
-            embed.description = "No content created by this user."
-
-        await thread.send(embed=embed)
+    async def post_maker_profile(self, destination: discord.abc.Messageable, profile_data: Dict[str, Any]) -> None:
+        """Post maker profile embed."""
+        await self._send(destination, _maker_profile_embed(profile_data))
+
+    async def post_maker_content(self, destination: discord.abc.Messageable, content_data: Dict[str, Any],
+                                 username: str, skip_machine_id: Optional[int] = None) -> None:
+        """Post maker content embed."""
+        await self._send(destination, await self.build_content_embed(content_data, username, skip_machine_id))
 
 class OSINTCommands(commands.Cog):
     """OSINT command handlers for machine and user lookups."""
 
     def __init__(self, config):
         self.config = config
-        self.headers = {
-            "Authorization": f"Bearer {config.get('api.htb_bearer_token')}",
-            "Accept": "application/json",
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/117.0.0.0 Safari/537.36 Edg/117.0.2045.55"
-            ),
-        }
+        self.helper = OSINTHelper(config)
+        self._warm_up_task: Optional[asyncio.Task] = None
 
-    @staticmethod
-    def is_valid_url(url: str) -> bool:
-        """Check if URL is valid."""
-        if not url:
-            return False
-        url = url.strip()
-        parsed = urlparse(url)
-        return parsed.scheme in ("http", "https") and bool(parsed.netloc)
+    async def cog_load(self) -> None:
+        """Warm up the HTB API connection in the background."""
+        self._warm_up_task = asyncio.create_task(self.helper.warm_up())
+
+    async def cog_unload(self) -> None:
+        """Release the HTTP session when the cog is removed."""
+        if self._warm_up_task and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+        await self.helper.close()
 
     @commands.command()
     async def osint(self, ctx, machine_name: str):
         """Fetch machine profile and creator details."""
-        api_url = f"https://labs.hackthebox.com/api/v4/machine/profile/{machine_name}"
-
         try:
             # Fetch machine data
-            machine_response = requests.get(api_url, headers=self.headers)
-            if machine_response.status_code != 200:
-                await ctx.send(f"Failed to fetch machine '{machine_name}'. Error: {machine_response.status_code}")
+            status, machine_data = await self.helper.fetch_machine_profile_status(machine_name)
+            if status != 200:
+                await ctx.send(f"Failed to fetch machine '{machine_name}'. Error: {status}")
                 return
 
-            machine_data = machine_response.json().get("info", {})
             if not machine_data:
                 await ctx.send(f"Machine '{machine_name}' not found or no data returned.")
                 return
@@ -478,75 +745,23 @@ class OSINTCommands(commands.Cog):
 
     async def send_machine_info(self, ctx, machine_data: Dict[str, Any]) -> None:
         """Send machine information embed."""
-        difficulty = machine_data.get("difficultyText", "Unknown")
-        os_type = machine_data.get("os", "Unknown")
-        creator1 = machine_data.get("maker", {})
-        creator2 = machine_data.get("maker2", {})
-
-        # Handle avatar
-        avatar_path = machine_data.get("avatar", "")
-        machine_thumbnail = None
-        if avatar_path:
-            avatar_path = avatar_path.strip()
-            avatar_url = (avatar_path if avatar_path.startswith("http")
-                         else f"https://htb-mp-prod-public-storage.s3.eu-central-1.amazonaws.com{avatar_path}")
-            if self.is_valid_url(avatar_url):
-                machine_thumbnail = avatar_url
-
-        # Create embed
-        embed = discord.Embed(
-            title=f"Machine: {machine_data.get('name', 'Unknown')}",
-            description=f"**Difficulty:** {difficulty}\n**OS:** {os_type}",
-            color=discord.Color.blue()
-        )
-
-        if machine_thumbnail:
-            embed.set_thumbnail(url=machine_thumbnail)
-
-        # Add creator information
-        if creator1:
-            profile_url = f"https://app.hackthebox.com/profile/{creator1.get('id')}"
-            embed.add_field(
-                name="Maker 1",
-                value=f"[{creator1.get('name', 'Unknown')}]({profile_url})",
-                inline=False
-            )
-            embed.add_field(name="Maker 1 ID", value=creator1.get("id", "Unknown"), inline=True)
-
-        if creator2:
-            profile_url = f"https://app.hackthebox.com/profile/{creator2.get('id')}"
-            embed.add_field(
-                name="Maker 2",
-                value=f"[{creator2.get('name', 'Unknown')}]({profile_url})",
-                inline=False
-            )
-            embed.add_field(name="Maker 2 ID", value=creator2.get("id", "Unknown"), inline=True)
-
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_build_machine_embed(machine_data, title="Machine"))
 
     async def fetch_and_display_maker(self, ctx, maker_id: int, skip_machine_id: Optional[int] = None) -> None:
         """Fetch and display maker profile and content."""
-        profile_url = f"https://labs.hackthebox.com/api/v4/user/profile/basic/{maker_id}"
-        content_url = f"https://labs.hackthebox.com/api/v4/user/profile/content/{maker_id}"
-
         try:
-            # Fetch profile data
-            profile_response = requests.get(profile_url, headers=self.headers)
-            if profile_response.status_code != 200:
-                await ctx.send(f"Failed to fetch profile for Maker ID {maker_id}. Error: {profile_response.status_code}")
+            status, maker_info = await self.helper.fetch_maker_info(maker_id, skip_machine_id)
+            if not maker_info:
+                await ctx.send(f"Failed to fetch profile for Maker ID {maker_id}. Error: {status}")
                 return
 
-            profile_data = profile_response.json().get("profile", {})
-
-            # Fetch content data
-            content_response = requests.get(content_url, headers=self.headers)
-            content_data = content_response.json().get("profile", {}).get("content", {})
+            profile_data = maker_info['profile']
 
             # Send profile info
             await self.send_maker_profile(ctx, profile_data)
 
             # Send content info
-            await self.send_maker_content(ctx, content_data, profile_data.get("name", "Unknown"), skip_machine_id)
+            await self.send_maker_content(ctx, maker_info['content'], profile_data.get("name", "Unknown"), skip_machine_id)
 
         except Exception as e:
             logger.error(f"Error fetching maker details: {e}")
@@ -554,144 +769,9 @@ class OSINTCommands(commands.Cog):
 
     async def send_maker_profile(self, ctx, profile_data: Dict[str, Any]) -> None:
         """Send maker profile embed."""
-        # Handle avatar
-        avatar_path = profile_data.get("avatar", "")
-        user_thumbnail = None
-        if avatar_path:
-            avatar_path = avatar_path.strip()
-            if avatar_path.startswith("/"):
-                avatar_url = f"https://account.hackthebox.com{avatar_path}"
-            elif avatar_path.startswith("http"):
-                avatar_url = avatar_path
-            else:
-                avatar_url = None
-
-            if avatar_url and self.is_valid_url(avatar_url):
-                user_thumbnail = avatar_url
-
-        # Create embed
-        embed = discord.Embed(
-            title=f"Maker: {profile_data.get('name', 'Unknown')}",
-            color=discord.Color.gold()
-        )
-
-        if user_thumbnail:
-            embed.set_thumbnail(url=user_thumbnail)
-
-        # Add profile fields
-        embed.add_field(name="System Owns", value=profile_data.get("system_owns", "N/A"), inline=True)
-        embed.add_field(name="User Owns", value=profile_data.get("user_owns", "N/A"), inline=True)
-        embed.add_field(name="Respects", value=profile_data.get("respects", "N/A"), inline=True)
-        embed.add_field(name="Rank", value=profile_data.get("rank", "N/A"), inline=True)
-        embed.add_field(name="Ranking", value=profile_data.get("ranking", "N/A"), inline=True)
-        embed.add_field(name="Country", value=profile_data.get("country_name", "N/A"), inline=True)
-        embed.add_field(name="Time Zone", value=profile_data.get("timezone", "N/A"), inline=True)
-
-        # Add team info
-        team = profile_data.get("team", {})
-        if team:
-            team_profile_url = f"https://app.hackthebox.com/team/{team.get('id')}"
-            embed.add_field(
-                name="Team",
-                value=f"[{team.get('name')}]({team_profile_url})",
-                inline=True
-            )
-            embed.add_field(name="Team Ranking", value=team.get("ranking", "N/A"), inline=True)
-
-        # Add social links
-        for social in ['github', 'linkedin', 'twitter']:
-            if profile_data.get(social):
-                embed.add_field(
-                    name=social.capitalize(),
-                    value=f"[{social.capitalize()}]({profile_data.get(social)})",
-                    inline=False
-                )
-
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_maker_profile_embed(profile_data, title="Maker"))
 
     async def send_maker_content(self, ctx, content_data: Dict[str, Any], username: str, skip_machine_id: Optional[int] = None) -> None:
-        """Send maker content embed."""
-        embed = discord.Embed(
-            title=f"Content Created by {username}",
-            color=discord.Color.blue()
-        )
-
-        def split_content(content: str, max_length: int = 1024) -> list:
-            """Split content into chunks that fit in embed fields."""
-            lines = content.split("\n")
-            chunks, current_chunk = [], ""
-            for line in lines:
-                if len(current_chunk) + len(line) + 1 > max_length:
-                    chunks.append(current_chunk)
-                    current_chunk = line + "\n"
-                else:
-                    current_chunk += line + "\n"
-            if current_chunk:
-                chunks.append(current_chunk)
-            return chunks
-
-        # Add machines
-        if content_data.get("machines"):
-            machine_list = ""
-            for machine in content_data["machines"]:
-                if skip_machine_id and machine.get("id") == skip_machine_id:
-                    continue
-                avatar_path = machine.get("machine_avatar", "")
-                avatar_url = f"https://labs.hackthebox.com{avatar_path}" if avatar_path else ""
-                machine_list += (
-                    f"- **[{machine['name']}]"
-                    f"(https://app.hackthebox.com/machines/{machine['id']})** "
-                    f"(OS: {machine['os']}, Difficulty: {machine['difficulty']}, "
-                    f"Rating: {machine['rating']})\n"
-                    f"  Avatar: {avatar_url}\n"
-                )
-
-            if machine_list:
-                for i, chunk in enumerate(split_content(machine_list)):
-                    embed.add_field(
-                        name=f"Created Machines (Part {i + 1})" if i > 0 else "Created Machines",
-                        value=chunk,
-                        inline=False
-                    )
-
-        # Add writeups
-        if content_data.get("writeups"):
-            writeup_list = ""
-            for writeup in content_data["writeups"]:
-                writeup_list += (
-                    f"- **{writeup['machine_name']}** (Type: {writeup['type']})\n"
-                    f"  URL: {writeup['url']}\n"
-                )
-
-            if writeup_list:
-                for i, chunk in enumerate(split_content(writeup_list)):
-                    embed.add_field(
-                        name=f"Created Writeups (Part {i + 1})" if i > 0 else "Created Writeups",
-                        value=chunk,
-                        inline=False
-                    )
-
-        # Add challenges
-        if content_data.get("challenges"):
-            challenge_list = ""
-            for challenge in content_data["challenges"]:
-                avatar_path = challenge.get("challenge_avatar", "")
-                avatar_url = f"https://labs.hackthebox.com{avatar_path}" if avatar_path else ""
-                challenge_list += (
-                    f"- **{challenge['name']}** (Category: {challenge['category']}, Difficulty: {challenge['difficulty']})\n"
-                    f"  Avatar: {avatar_url}\n"
-                )
-
-            if challenge_list:
-                for i, chunk in enumerate(split_content(challenge_list)):
-                    embed.add_field(
-                        name=f"Created Challenges (Part {i + 1})" if i > 0 else "Created Challenges",
-                        value=chunk,
-                        inline=False
-                    )
-
-        # Handle empty content
-        if not embed.fields:
-            embed.description = "No content created by this user."
-
-        await ctx.send(embed=embed)
\ No newline at end of file
+        """Send maker content embed without per-item detail lookups, as the command always has."""
+        fields = _render_content_fields(content_data, skip_machine_id, {}, {})
+        await ctx.send(embed=_build_maker_content_embed(username, fields, title="Content Created by"))
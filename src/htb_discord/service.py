@@ -1,10 +1,15 @@
 """Main service manager for HTB Discord integration."""
 
 import asyncio
+import functools
 import signal
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Dict, List, Optional
+import tracemalloc
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, Optional, Set
 from pathlib import Path
 
 import discord
@@ -12,31 +17,68 @@ from discord.ext import commands
 
 from .config import Config, ConfigError
 from .utils.database import DatabaseManager
-from .modules.machines import MachineMonitor
-from .modules.challenges import ChallengeMonitor
-from .modules.notices import NoticeMonitor
-from .modules.osint import OSINTCommands
-from .modules.linkwarden import LinkwardenForwarder
+from .utils.discord_helpers import DiscordHelpers, close_session
+
+# Feature modules are imported lazily so disabled features cost nothing at startup
+if TYPE_CHECKING:
+    from .modules.challenges import ChallengeMonitor
+    from .modules.linkwarden import LinkwardenForwarder
+    from .modules.machines import MachineMonitor
+    from .modules.notices import NoticeMonitor
 
 logger = logging.getLogger(__name__)
 
+# Seconds between allocation snapshots when --debug-memory is on
+LEAK_MONITOR_INTERVAL = 600
+
+# Frames kept per allocation so growth is attributed past library wrappers
+TRACEMALLOC_FRAMES = 25
+
+class _ShutdownRequested(Exception):
+    """Raised inside the task group to cancel its children on shutdown."""
+
 class HTBDiscordService:
     """Main service class that manages all HTB Discord integrations."""
 
-    def __init__(self, config_path: str = "config.yaml"):
+    def __init__(self, config_path: str = "config.yaml", debug_memory: bool = False,
+                 log_level: Optional[str] = None):
         self.config_path = config_path
+        self.debug_memory = debug_memory
+        self.log_level = log_level
         self.config: Optional[Config] = None
+        self._settings: Optional[SimpleNamespace] = None
         self.db_manager: Optional[DatabaseManager] = None
         self.client: Optional[discord.Client] = None
         self.bot: Optional[commands.Bot] = None
         self.monitors: Dict[str, object] = {}
-        self.tasks: List[asyncio.Task] = []
+        self.tasks: Set[asyncio.Task] = set()
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
         self.shutdown_event = asyncio.Event()
+        # Set only by signals; unlike shutdown_event it survives restarts
+        self._stop_requested = asyncio.Event()
         self.restart_count = 0
         self.max_restarts = 5
+        self._stopped = False
+
+    async def run(self) -> None:
+        """Run the service, always stopping it and closing async generators on the way out."""
+        try:
+            await self.start()
+        finally:
+            await self.stop()
+            await asyncio.get_running_loop().shutdown_asyncgens()
+            # Only now, so restart and shutdown messages still reach the handlers
+            self._stop_log_listener()
 
     async def start(self) -> None:
         """Start the service."""
+        if self._stop_requested.is_set():
+            logger.info("Shutdown requested, not starting")
+            return
+
+        self._stopped = False
+        # stop() sets the event; clear it so a restart doesn't shut straight down again
+        self.shutdown_event.clear()
         try:
             logger.info("Starting HTB Discord Service...")
 
@@ -58,6 +100,10 @@ class HTBDiscordService:
             # Setup signal handlers
             self._setup_signal_handlers()
 
+            # Enable allocation tracing and asyncio debug mode
+            if self.debug_memory:
+                self._setup_debug_memory()
+
             logger.info("Service started successfully")
 
             # Run Discord clients
@@ -66,32 +112,64 @@ class HTBDiscordService:
         except Exception as e:
             logger.critical(f"Failed to start service: {e}")
             await self.stop()
-            sys.exit(1)
+            raise
 
     async def stop(self) -> None:
         """Stop the service gracefully."""
+        if self._stopped:
+            return
+        self._stopped = True
+
         logger.info("Stopping HTB Discord Service...")
 
-        # Cancel all background tasks
-        for task in self.tasks:
-            if not task.cancelled():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+        # Cancel all background tasks and wait for them together
+        tasks = list(self.tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Close Discord connections; shielded so a second signal can't leave sockets open
+        close_task = self._spawn(self._close_discord_clients(), "close_discord")
+        try:
+            await asyncio.shield(close_task)
+        except asyncio.CancelledError:
+            await close_task
+            raise
+        finally:
+            # Close database connections
+            if self.db_manager:
+                self.db_manager.close_all()
+
+        # Set shutdown event
+        self.shutdown_event.set()
+
+        logger.info("Service stopped")
+
+    async def _close_discord_clients(self) -> None:
+        """Close the Discord client and bot connections."""
+        # Let monitors and cogs release their own HTTP sessions before the clients go away
+        await self._stop_monitors()
+        if self.bot:
+            for cog_name in list(self.bot.cogs):
+                await self.bot.remove_cog(cog_name)
 
-        # Close Discord connections
         if self.client and not self.client.is_closed():
             await self.client.close()
 
-        if self.bot and not self.bot.is_closed():
+        if self.bot and self.bot is not self.client and not self.bot.is_closed():
             await self.bot.close()
 
-        # Set shutdown event
-        self.shutdown_event.set()
+        # Shared image download session
+        await close_session()
 
-        logger.info("Service stopped")
+    async def _stop_monitors(self) -> None:
+        """Stop every initialized monitor and forget it."""
+        for name, monitor in self.monitors.items():
+            try:
+                await monitor.stop()
+            except Exception as e:
+                logger.error(f"Failed to stop {name} monitor: {e}")
+        self.monitors.clear()
 
     async def restart(self) -> None:
         """Restart the service."""
@@ -104,14 +182,31 @@ class HTBDiscordService:
         logger.info(f"Restarting service (attempt {self.restart_count})")
 
         await self.stop()
-        await asyncio.sleep(self.config.get('service.restart_delay', 30))
-        await self.start()
+
+        # Wait out the restart delay, but give up on restarting if a signal arrives meanwhile
+        try:
+            await asyncio.wait_for(self._stop_requested.wait(), self._settings.restart_delay)
+        except TimeoutError:
+            await self.start()
+        else:
+            logger.info("Shutdown requested, not restarting")
 
     async def _load_config(self) -> None:
         """Load and validate configuration."""
         try:
             self.config = Config(self.config_path)
             self.max_restarts = self.config.get('service.max_restarts', 5)
+
+            # Resolve settings read on the run/failure paths once
+            self._settings = SimpleNamespace(
+                restart_on_failure=bool(self.config.get('service.restart_on_failure', True)),
+                restart_delay=float(self.config.get('service.restart_delay', 30)),
+                discord_token=self.config.get('api.discord_token'),
+                features={
+                    name: self.config.is_feature_enabled(name)
+                    for name in ('machines', 'challenges', 'notices', 'osint', 'linkwarden')
+                },
+            )
             logger.info("Configuration loaded successfully")
         except ConfigError as e:
             logger.critical(f"Configuration error: {e}")
@@ -121,15 +216,36 @@ class HTBDiscordService:
         """Setup logging configuration."""
         log_config = self.config.get('logging', {})
 
-        # Configure root logger
+        # Real handlers run on the listener thread so log writes never block the event loop
+        formatter = logging.Formatter(
+            log_config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        )
+        handlers = [
+            logging.StreamHandler(sys.stdout),
+            logging.FileHandler(log_config.get('file', 'logs/htb_discord.log'))
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        # On restart, drain the previous listener; basicConfig(force=True) then closes its handlers
+        self._stop_log_listener()
+
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+        # Configure root logger, replacing the CLI's bootstrap handler; --log-level wins over config
+        level = self.log_level or log_config.get('level', 'INFO')
         logging.basicConfig(
-            level=getattr(logging, log_config.get('level', 'INFO')),
-            format=log_config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler(log_config.get('file', 'logs/htb_discord.log'))
-            ]
+            level=getattr(logging, level),
+            handlers=[queue_handler],
+            force=True
+        )
+
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
         )
+        self._log_listener.start()
 
         # Set Discord library log level
         discord_logger = logging.getLogger('discord')
@@ -137,6 +253,22 @@ class HTBDiscordService:
 
         logger.info("Logging configured")
 
+    def _stop_log_listener(self) -> None:
+        """Drain the log queue and hand its handlers back to the root logger."""
+        if not self._log_listener:
+            return
+
+        self._log_listener.stop()
+
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root.removeHandler(handler)
+        for handler in self._log_listener.handlers:
+            root.addHandler(handler)
+
+        self._log_listener = None
+
     async def _initialize_database(self) -> None:
         """Initialize database manager."""
         self.db_manager = DatabaseManager(self.config)
@@ -153,13 +285,18 @@ class HTBDiscordService:
         intents.guilds = intents_config.get('guilds', True)
         intents.messages = intents_config.get('messages', True)
 
-        # Create main client for monitors
-        self.client = discord.Client(intents=intents)
-
-        # Create bot for commands (if OSINT is enabled)
-        if self.config.is_feature_enabled('osint'):
+        # A Bot is a Client, so when OSINT needs commands one connection serves both
+        if self._settings.features['osint']:
             prefix = self.config.get('features.osint.command_prefix', '!')
             self.bot = commands.Bot(command_prefix=prefix, intents=intents)
+            self.client = self.bot
+        else:
+            self.client = discord.Client(intents=intents)
+
+        # Renamed forum tags keep the same count, so drop the cached mapping on any update
+        @self.client.event
+        async def on_guild_channel_update(before, after):
+            DiscordHelpers.invalidate_forum_tags(after.id)
 
         # Setup activity
         activity_config = discord_config.get('activity', {})
@@ -173,105 +310,179 @@ class HTBDiscordService:
                 await self.client.change_presence(activity=activity)
                 logger.info(f"Discord client ready: {self.client.user}")
 
-            if self.bot:
-                @self.bot.event
-                async def on_ready():
-                    await self.bot.change_presence(activity=activity)
-                    logger.info(f"Discord bot ready: {self.bot.user}")
-
         logger.info("Discord clients configured")
 
     async def _initialize_modules(self) -> None:
         """Initialize monitoring modules based on configuration."""
-        token = self.config.get('api.discord_token')
-
-        # Initialize machine monitor
-        if self.config.is_feature_enabled('machines'):
-            self.monitors['machines'] = MachineMonitor(self.config, self.db_manager, self.client)
-            logger.info("Machine monitor initialized")
-
-        # Initialize challenge monitor
-        if self.config.is_feature_enabled('challenges'):
-            self.monitors['challenges'] = ChallengeMonitor(self.config, self.db_manager, self.client)
-            logger.info("Challenge monitor initialized")
-
-        # Initialize notice monitor
-        if self.config.is_feature_enabled('notices'):
-            self.monitors['notices'] = NoticeMonitor(self.config, self.db_manager, self.client)
-            logger.info("Notice monitor initialized")
-
-        # Initialize OSINT commands
-        if self.config.is_feature_enabled('osint') and self.bot:
-            osint_cog = OSINTCommands(self.config)
-            await self.bot.add_cog(osint_cog)
-            logger.info("OSINT commands initialized")
-
-        # Initialize Linkwarden forwarder
-        if self.config.is_feature_enabled('linkwarden'):
-            self.monitors['linkwarden'] = LinkwardenForwarder(self.config, self.db_manager, self.client)
-            logger.info("Linkwarden forwarder initialized")
+        features = self._settings.features
+        initializers = {
+            'machines': self._init_machines,
+            'challenges': self._init_challenges,
+            'notices': self._init_notices,
+            'osint': self._init_osint,
+            'linkwarden': self._init_linkwarden,
+        }
+        enabled = [name for name in initializers if features[name]]
+
+        # Initializations are independent, so let their I/O overlap
+        results = await asyncio.gather(
+            *(initializers[name]() for name in enabled), return_exceptions=True
+        )
+
+        for name, result in zip(enabled, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to initialize {name}: {result}")
+            elif result is not None:
+                self.monitors[name] = result
+
+    async def _init_machines(self) -> "MachineMonitor":
+        """Initialize machine monitor."""
+        from .modules.machines import MachineMonitor
+
+        monitor = MachineMonitor(self.config, self.db_manager, self.client)
+        logger.info("Machine monitor initialized")
+        return monitor
+
+    async def _init_challenges(self) -> "ChallengeMonitor":
+        """Initialize challenge monitor."""
+        from .modules.challenges import ChallengeMonitor
+
+        monitor = ChallengeMonitor(self.config, self.db_manager, self.client)
+        logger.info("Challenge monitor initialized")
+        return monitor
+
+    async def _init_notices(self) -> "NoticeMonitor":
+        """Initialize notice monitor."""
+        from .modules.notices import NoticeMonitor
+
+        monitor = NoticeMonitor(self.config, self.db_manager, self.client)
+        logger.info("Notice monitor initialized")
+        return monitor
+
+    async def _init_osint(self) -> None:
+        """Initialize OSINT commands."""
+        if not self.bot:
+            return None
+
+        from .modules.osint import OSINTCommands
+
+        osint_cog = OSINTCommands(self.config)
+        await self.bot.add_cog(osint_cog)
+        logger.info("OSINT commands initialized")
+        return None
+
+    async def _init_linkwarden(self) -> "LinkwardenForwarder":
+        """Initialize Linkwarden forwarder."""
+        from .modules.linkwarden import LinkwardenForwarder
+
+        monitor = LinkwardenForwarder(self.config, self.db_manager, self.client)
+        logger.info("Linkwarden forwarder initialized")
+        return monitor
 
     def _setup_signal_handlers(self) -> None:
         """Setup signal handlers for graceful shutdown."""
-        def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}, initiating shutdown...")
-            asyncio.create_task(self.stop())
-
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        loop = asyncio.get_running_loop()
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, functools.partial(self._on_signal, sig))
+            except NotImplementedError:
+                # Windows event loops don't support add_signal_handler
+                signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(self._on_signal, signum))
+
+    def _on_signal(self, signum: int) -> None:
+        """Handle a shutdown signal on the event loop."""
+        logger.info(f"Received signal {signum}, initiating shutdown...")
+        self._stop_requested.set()
+        self.shutdown_event.set()
 
     async def _run_discord_clients(self) -> None:
         """Run Discord clients and monitoring tasks."""
-        tasks = []
+        # The writer outlives the group so the monitors' final writes still land; stop() cancels it
+        self._spawn(self.db_manager.writer.run(), "db_writer")
+
+        if self.debug_memory:
+            self._spawn(self._leak_monitor(), "leak_monitor")
+
+        shutdown = failed = False
+        try:
+            # The group cancels and awaits every child together when any of them raises
+            async with asyncio.TaskGroup() as tg:
+                # Start main client
+                if self.client:
+                    tg.create_task(self.client.start(self._settings.discord_token), name="discord_client")
+
+                # Start bot (only if it isn't the same connection as the client)
+                if self.bot and self.bot is not self.client:
+                    tg.create_task(self.bot.start(self._settings.discord_token), name="discord_bot")
+
+                # Start monitoring tasks
+                for name, monitor in self.monitors.items():
+                    if hasattr(monitor, 'start'):
+                        tg.create_task(monitor.start(), name=f"monitor_{name}")
+
+                tg.create_task(self._wait_for_shutdown(), name="shutdown_waiter")
+
+        except* _ShutdownRequested:
+            shutdown = True
+        except* Exception as eg:
+            failed = True
+            for exc in eg.exceptions:
+                logger.error(f"Task failed: {exc}", exc_info=exc)
+
+        if failed and not shutdown and self._settings.restart_on_failure:
+            await self.restart()
+        else:
+            await self.stop()
 
-        # Start main client
-        if self.client:
-            tasks.append(asyncio.create_task(
-                self.client.start(self.config.get('api.discord_token'))
-            ))
+    def _setup_debug_memory(self) -> None:
+        """Start tracemalloc and report slow event loop callbacks."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
 
-        # Start bot (if different from client)
-        if self.bot and self.bot != self.client:
-            tasks.append(asyncio.create_task(
-                self.bot.start(self.config.get('api.discord_token'))
-            ))
+        loop = asyncio.get_running_loop()
+        loop.set_debug(True)
+        loop.slow_callback_duration = 0.1
+        logger.info("Memory debugging enabled")
 
-        # Start monitoring tasks
-        for name, monitor in self.monitors.items():
-            if hasattr(monitor, 'start'):
-                task = asyncio.create_task(monitor.start())
-                task.set_name(f"monitor_{name}")
-                tasks.append(task)
-                self.tasks.append(task)
+    async def _leak_monitor(self, interval: float = LEAK_MONITOR_INTERVAL) -> None:
+        """Periodically log the allocation sites that grew the most."""
+        previous = await asyncio.to_thread(tracemalloc.take_snapshot)
 
-        try:
-            # Wait for shutdown signal or client failure
-            done, pending = await asyncio.wait(
-                tasks + [asyncio.create_task(self.shutdown_event.wait())],
-                return_when=asyncio.FIRST_COMPLETED
+        while True:
+            await asyncio.sleep(interval)
+
+            # Snapshots and diffs are CPU heavy, so keep them off the event loop
+            snapshot = await asyncio.to_thread(tracemalloc.take_snapshot)
+            stats = await asyncio.to_thread(snapshot.compare_to, previous, 'lineno')
+            previous = snapshot
+
+            logger.info(
+                "Top memory growth since last snapshot:\n%s",
+                "\n".join(str(stat) for stat in stats[:10])
             )
 
-            # Cancel remaining tasks
-            for task in pending:
-                task.cancel()
-
-            # Check if any tasks failed
-            for task in done:
-                if task.get_name() != 'shutdown_event' and not task.cancelled():
-                    try:
-                        await task
-                    except Exception as e:
-                        logger.error(f"Task {task.get_name()} failed: {e}")
-                        if self.config.get('service.restart_on_failure', True):
-                            await self.restart()
-                            return
+    async def _wait_for_shutdown(self) -> None:
+        """Unwind the task group once shutdown is requested."""
+        await self.shutdown_event.wait()
+        raise _ShutdownRequested
+
+    def _spawn(self, coro, name: str) -> asyncio.Task:
+        """Create a task tracked in self.tasks until it finishes."""
+        task = asyncio.create_task(coro, name=name)
+        self.tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+        return task
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        """Drop a finished task from the registry and log it if it failed."""
+        self.tasks.discard(task)
+        if task.cancelled():
+            return
 
-        except Exception as e:
-            logger.critical(f"Critical error in main loop: {e}")
-            if self.config.get('service.restart_on_failure', True):
-                await self.restart()
-            else:
-                await self.stop()
+        exc = task.exception()
+        if exc is not None:
+            logger.error(f"Task {task.get_name()} failed: {exc}", exc_info=exc)
 
 async def main():
     """Main entry point."""
@@ -282,6 +493,8 @@ async def main():
                        help='Configuration file path (default: config.yaml)')
     parser.add_argument('--log-level', '-l', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
                        help='Override log level')
+    parser.add_argument('--debug-memory', action='store_true',
+                       help='Trace allocations and log the top memory growth periodically')
 
     args = parser.parse_args()
 
@@ -289,9 +502,13 @@ async def main():
     if args.log_level:
         logging.basicConfig(level=getattr(logging, args.log_level))
 
-    # Create and start service
-    service = HTBDiscordService(args.config)
-    await service.start()
+    # Create and run service; failures are already logged by the service
+    service = HTBDiscordService(args.config, debug_memory=args.debug_memory, log_level=args.log_level)
+    try:
+        await service.run()
+    except Exception:
+        return 1
+    return 0
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
\ No newline at end of file
@@ -1,13 +1,112 @@
 """Database utilities for HTB Discord service."""
 
+import asyncio
+import hashlib
 import sqlite3
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Callable, List, Iterable, Set
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Stay below SQLite's default limit of 999 bound parameters per statement
+MAX_QUERY_PARAMS = 900
+
+# Larger pages for the links database, applied only when the file is first created
+LINKS_PAGE_SIZE = 8192
+
+# Statement cache size per connection; comfortably above the number of distinct statements
+CACHED_STATEMENTS = 256
+
+# Hot-path statements, kept as constants so every call hits SQLite's statement cache
+SQL_MACHINE_EXISTS = 'SELECT 1 FROM tracked_machines WHERE id = ?'
+SQL_ADD_MACHINE = (
+    'INSERT OR IGNORE INTO tracked_machines (id, name, os, difficulty, release_date) VALUES (?, ?, ?, ?, ?)'
+)
+SQL_CHALLENGE_EXISTS = 'SELECT 1 FROM tracked_challenges WHERE id = ?'
+SQL_ADD_CHALLENGE = (
+    'INSERT OR IGNORE INTO tracked_challenges (id, name, difficulty, category, release_date) VALUES (?, ?, ?, ?, ?)'
+)
+SQL_NOTICE_EXISTS = 'SELECT 1 FROM sent_notices WHERE id = ?'
+SQL_ADD_NOTICE = 'INSERT OR IGNORE INTO sent_notices (id) VALUES (?)'
+SQL_SAVE_LINK = 'INSERT OR IGNORE INTO links (channel_name, link, link_hash) VALUES (?, ?, ?)'
+SQL_GET_UNPROCESSED_LINKS = 'SELECT id, channel_name, link FROM links WHERE processed = 0 ORDER BY id LIMIT ?'
+SQL_GET_UNPROCESSED_LINKS_AFTER = (
+    'SELECT id, channel_name, link FROM links WHERE processed = 0 AND id > ? ORDER BY id LIMIT ?'
+)
+SQL_MARK_LINK_PROCESSED = 'UPDATE links SET processed = 1 WHERE id = ?'
+
+def link_hash(link: str) -> bytes:
+    """Fixed-size dedup key for a link."""
+    return hashlib.sha256(link.encode()).digest()
+
+def _settle(future: asyncio.Future, result: Any, exc: Optional[BaseException]) -> None:
+    """Resolve a write future unless the caller already gave up on it."""
+    if future.done():
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+class DatabaseWriter:
+    """Runs database writes in order on a single worker thread, off the event loop."""
+
+    def __init__(self):
+        self._q: asyncio.Queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-writer')
+        self._running = False
+
+    async def run(self) -> None:
+        """Consume queued writes until cancelled, then hand off anything left over."""
+        loop = asyncio.get_running_loop()
+        self._running = True
+        try:
+            while True:
+                fn, args, future = await self._q.get()
+                # Shielded so a cancelled worker never drops a write that was already queued
+                await asyncio.shield(asyncio.wrap_future(
+                    self._executor.submit(self._call, loop, future, fn, args)
+                ))
+        finally:
+            self._running = False
+            while not self._q.empty():
+                fn, args, future = self._q.get_nowait()
+                self._executor.submit(self._call, loop, future, fn, args)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> asyncio.Future:
+        """Queue a write and return a future for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if self._running:
+            self._q.put_nowait((fn, args, future))
+        else:
+            # No worker (not started yet or shutting down): go straight to the thread
+            self._executor.submit(self._call, loop, future, fn, args)
+        return future
+
+    def close(self) -> None:
+        """Wait for in-flight writes and stop the worker thread."""
+        self._executor.shutdown(wait=True)
+
+    @staticmethod
+    def _call(loop: asyncio.AbstractEventLoop, future: asyncio.Future,
+              fn: Callable[..., Any], args: tuple) -> None:
+        """Run one write on the worker thread and settle its future on the loop."""
+        try:
+            result, exc = fn(*args), None
+        except Exception as e:
+            result, exc = None, e
+
+        try:
+            loop.call_soon_threadsafe(_settle, future, result, exc)
+        except RuntimeError:
+            # Loop already closed; nobody is waiting for the result
+            pass
+
 class DatabaseManager:
     """Manages SQLite databases for the service."""
 
@@ -19,6 +118,14 @@ class DatabaseManager:
             'notices': config.get('database.notices_db'),
             'links': config.get('database.links_db')
         }
+
+        # One long-lived connection per database, each shared under its own lock
+        self._conns: Dict[str, sqlite3.Connection] = {}
+        self._locks: Dict[str, threading.RLock] = {db_name: threading.RLock() for db_name in self.db_paths}
+
+        # Async callers route writes through here so commits never block the event loop
+        self.writer = DatabaseWriter()
+
         self.initialize_all()
 
     def initialize_all(self) -> None:
@@ -77,33 +184,130 @@ class DatabaseManager:
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         channel_name TEXT,
                         link TEXT,
+                        link_hash BLOB,
                         processed INTEGER DEFAULT 0,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     )
                 ''')
 
+                # The hash index is created by the migration, so once it exists there is nothing to redo
+                migrated = cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_links_link_hash'"
+                ).fetchone()
+                if not migrated:
+                    self._migrate_links(conn)
+
+                cursor.execute(
+                    'CREATE INDEX IF NOT EXISTS idx_links_processed ON links(processed) WHERE processed = 0'
+                )
+
             conn.commit()
-            logger.debug(f"Initialized database: {db_name}")
+            logger.debug("Initialized database: %s", db_name)
+
+    @staticmethod
+    def _migrate_links(conn: sqlite3.Connection) -> None:
+        """Dedup older links tables and move them onto the link_hash unique index."""
+        cursor = conn.cursor()
+
+        # Older databases may hold duplicate links; keep the first of each
+        cursor.execute('''
+            DELETE FROM links
+            WHERE id NOT IN (SELECT MIN(id) FROM links GROUP BY link)
+        ''')
+        if cursor.rowcount:
+            logger.info(f"Removed {cursor.rowcount} duplicate links")
+
+        # Older databases predate link_hash; add and backfill it
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(links)')}
+        if 'link_hash' not in columns:
+            cursor.execute('ALTER TABLE links ADD COLUMN link_hash BLOB')
+        conn.create_function('link_hash', 1, link_hash, deterministic=True)
+        cursor.execute('UPDATE links SET link_hash = link_hash(link) WHERE link_hash IS NULL')
+
+        # Dedup on the 32-byte hash rather than the full URL
+        cursor.execute('DROP INDEX IF EXISTS idx_links_link')
+        cursor.execute('CREATE UNIQUE INDEX idx_links_link_hash ON links(link_hash)')
+
+    def _get(self, db_name: str) -> sqlite3.Connection:
+        """Get the cached connection for a database, opening it on first use."""
+        conn = self._conns.get(db_name)
+        if conn is not None:
+            return conn
 
-    @contextmanager
-    def get_connection(self, db_name: str):
-        """Get database connection with context manager."""
         db_path = self.db_paths.get(db_name)
         if not db_path:
             raise ValueError(f"Unknown database: {db_name}")
 
-        conn = sqlite3.connect(db_path)
-        try:
-            yield conn
-        finally:
-            conn.close()
+        is_new = not Path(db_path).exists() or Path(db_path).stat().st_size == 0
+
+        conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=CACHED_STATEMENTS)
+        if db_name == 'links' and is_new:
+            # Page size is fixed once the file exists, so set it before WAL writes the header
+            conn.execute(f'PRAGMA page_size={LINKS_PAGE_SIZE}')
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')
+
+        self._conns[db_name] = conn
+        logger.debug("Opened database connection: %s", db_name)
+        return conn
+
+    @contextmanager
+    def get_connection(self, db_name: str):
+        """Get the shared database connection with context manager."""
+        lock = self._locks.get(db_name)
+        if lock is None:
+            raise ValueError(f"Unknown database: {db_name}")
+
+        with lock:
+            conn = self._get(db_name)
+            try:
+                yield conn
+            except Exception:
+                # Don't leave a half-finished transaction on the shared connection
+                conn.rollback()
+                raise
+
+    def close_all(self) -> None:
+        """Close all cached database connections."""
+        self.writer.close()
+
+        for db_name, lock in self._locks.items():
+            with lock:
+                conn = self._conns.pop(db_name, None)
+                if conn is None:
+                    continue
+                try:
+                    conn.close()
+                except Exception as e:
+                    logger.error(f"Failed to close database {db_name}: {e}")
+
+    def existing_ids(self, db_name: str, table: str, ids: Iterable[int]) -> Set[int]:
+        """Return the subset of ids already present in a table."""
+        ids = list(ids)
+        existing: Set[int] = set()
+
+        with self.get_connection(db_name) as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(ids), MAX_QUERY_PARAMS):
+                chunk = ids[start:start + MAX_QUERY_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f'SELECT id FROM {table} WHERE id IN ({placeholders})', chunk)
+                existing.update(row[0] for row in cursor.fetchall())
+
+        return existing
+
+    async def existing_ids_async(self, db_name: str, table: str, ids: Iterable[int]) -> Set[int]:
+        """Look up existing ids on a worker thread so the event loop never waits on the lock."""
+        return await asyncio.to_thread(self.existing_ids, db_name, table, list(ids))
 
     # Machine database methods
     def machine_exists(self, machine_id: int) -> bool:
-        """Check if machine exists in database."""
+        """Check if machine exists in database (prefer existing_ids for batches)."""
         with self.get_connection('machines') as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT 1 FROM tracked_machines WHERE id = ?', (machine_id,))
+            cursor.execute(SQL_MACHINE_EXISTS, (machine_id,))
             return cursor.fetchone() is not None
 
     def add_machine(self, machine: Dict[str, Any]) -> bool:
@@ -111,10 +315,7 @@ class DatabaseManager:
         try:
             with self.get_connection('machines') as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO tracked_machines (id, name, os, difficulty, release_date)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
+                cursor.execute(SQL_ADD_MACHINE, (
                     machine['id'],
                     machine['name'],
                     machine['os'],
@@ -122,18 +323,24 @@ class DatabaseManager:
                     machine['release']
                 ))
                 conn.commit()
-                logger.debug(f"Added machine to database: {machine['name']}")
+                if cursor.rowcount != 1:
+                    return False
+                logger.debug("Added machine to database: %s", machine['name'])
                 return True
         except Exception as e:
             logger.error(f"Failed to add machine to database: {e}")
             return False
 
+    async def add_machine_async(self, machine: Dict[str, Any]) -> bool:
+        """Add a machine via the background writer."""
+        return await self.writer.submit(self.add_machine, machine)
+
     # Challenge database methods
     def challenge_exists(self, challenge_id: int) -> bool:
-        """Check if challenge exists in database."""
+        """Check if challenge exists in database (prefer existing_ids for batches)."""
         with self.get_connection('challenges') as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT 1 FROM tracked_challenges WHERE id = ?', (challenge_id,))
+            cursor.execute(SQL_CHALLENGE_EXISTS, (challenge_id,))
             return cursor.fetchone() is not None
 
     def add_challenge(self, challenge: Dict[str, Any]) -> bool:
@@ -141,10 +348,7 @@ class DatabaseManager:
         try:
             with self.get_connection('challenges') as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO tracked_challenges (id, name, difficulty, category, release_date)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
+                cursor.execute(SQL_ADD_CHALLENGE, (
                     challenge['id'],
                     challenge['name'],
                     challenge['difficulty'],
@@ -152,18 +356,24 @@ class DatabaseManager:
                     challenge['release_date']
                 ))
                 conn.commit()
-                logger.debug(f"Added challenge to database: {challenge['name']}")
+                if cursor.rowcount != 1:
+                    return False
+                logger.debug("Added challenge to database: %s", challenge['name'])
                 return True
         except Exception as e:
             logger.error(f"Failed to add challenge to database: {e}")
             return False
 
+    async def add_challenge_async(self, challenge: Dict[str, Any]) -> bool:
+        """Add a challenge via the background writer."""
+        return await self.writer.submit(self.add_challenge, challenge)
+
     # Notice database methods
     def notice_exists(self, notice_id: int) -> bool:
-        """Check if notice exists in database."""
+        """Check if notice exists in database (prefer existing_ids for batches)."""
         with self.get_connection('notices') as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT 1 FROM sent_notices WHERE id = ?', (notice_id,))
+            cursor.execute(SQL_NOTICE_EXISTS, (notice_id,))
             return cursor.fetchone() is not None
 
     def add_notice(self, notice_id: int) -> bool:
@@ -171,57 +381,79 @@ class DatabaseManager:
         try:
             with self.get_connection('notices') as conn:
                 cursor = conn.cursor()
-                cursor.execute('INSERT INTO sent_notices (id) VALUES (?)', (notice_id,))
+                cursor.execute(SQL_ADD_NOTICE, (notice_id,))
                 conn.commit()
-                logger.debug(f"Added notice to database: {notice_id}")
+                if cursor.rowcount != 1:
+                    return False
+                logger.debug("Added notice to database: %s", notice_id)
                 return True
         except Exception as e:
             logger.error(f"Failed to add notice to database: {e}")
             return False
 
+    async def add_notice_async(self, notice_id: int) -> bool:
+        """Add a notice via the background writer."""
+        return await self.writer.submit(self.add_notice, notice_id)
+
     # Link database methods
     def save_link(self, channel_name: str, link: str) -> bool:
         """Save link to database if not already present."""
         try:
             with self.get_connection('links') as conn:
                 cursor = conn.cursor()
-                cursor.execute('SELECT 1 FROM links WHERE link = ?', (link,))
-                if not cursor.fetchone():
-                    cursor.execute(
-                        'INSERT INTO links (channel_name, link) VALUES (?, ?)',
-                        (channel_name, link)
-                    )
-                    conn.commit()
-                    logger.debug(f"Saved link to database: {link}")
-                    return True
-                return False
+                cursor.execute(SQL_SAVE_LINK, (channel_name, link, link_hash(link)))
+                conn.commit()
+                if cursor.rowcount != 1:
+                    return False
+                logger.debug("Saved link to database: %s", link)
+                return True
         except Exception as e:
             logger.error(f"Failed to save link to database: {e}")
             return False
 
+    async def save_link_async(self, channel_name: str, link: str) -> bool:
+        """Save a link via the background writer."""
+        return await self.writer.submit(self.save_link, channel_name, link)
+
     def get_unprocessed_links(self, limit: int = 10) -> List[tuple]:
         """Get unprocessed links from database."""
         try:
             with self.get_connection('links') as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    'SELECT id, channel_name, link FROM links WHERE processed = 0 LIMIT ?',
-                    (limit,)
-                )
+                cursor.execute(SQL_GET_UNPROCESSED_LINKS, (limit,))
+                return cursor.fetchall()
+        except Exception as e:
+            logger.error(f"Failed to get unprocessed links: {e}")
+            return []
+
+    def get_unprocessed_links_after(self, last_id: int, limit: int = 10) -> List[tuple]:
+        """Get the next page of unprocessed links with ids above last_id."""
+        try:
+            with self.get_connection('links') as conn:
+                cursor = conn.cursor()
+                cursor.execute(SQL_GET_UNPROCESSED_LINKS_AFTER, (last_id, limit))
                 return cursor.fetchall()
         except Exception as e:
             logger.error(f"Failed to get unprocessed links: {e}")
             return []
 
+    async def get_unprocessed_links_after_async(self, last_id: int, limit: int = 10) -> List[tuple]:
+        """Fetch the next page of unprocessed links on a worker thread."""
+        return await asyncio.to_thread(self.get_unprocessed_links_after, last_id, limit)
+
     def mark_link_processed(self, link_id: int) -> bool:
         """Mark link as processed."""
         try:
             with self.get_connection('links') as conn:
                 cursor = conn.cursor()
-                cursor.execute('UPDATE links SET processed = 1 WHERE id = ?', (link_id,))
+                cursor.execute(SQL_MARK_LINK_PROCESSED, (link_id,))
                 conn.commit()
-                logger.debug(f"Marked link as processed: {link_id}")
+                logger.debug("Marked link as processed: %s", link_id)
                 return True
         except Exception as e:
             logger.error(f"Failed to mark link as processed: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    async def mark_link_processed_async(self, link_id: int) -> bool:
+        """Mark a link as processed via the background writer."""
+        return await self.writer.submit(self.mark_link_processed, link_id)
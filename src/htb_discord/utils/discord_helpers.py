@@ -3,25 +3,111 @@
 import discord
 import aiohttp
 import asyncio
+import functools
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime, timezone, timedelta
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Tuple
+from datetime import datetime
+
+from .cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Channels fetched over the API; missing/forbidden ids are cached briefly as _NO_CHANNEL
+CHANNEL_CACHE_TTL = 300
+CHANNEL_NEGATIVE_TTL = 60
+_NO_CHANNEL = object()
+_channel_cache = TTLCache(maxsize=256, ttl=CHANNEL_CACHE_TTL)
+
+# Lowercased tag name -> tag per forum, with the tag count as a cheap staleness check
+_forum_tag_cache: Dict[int, Tuple[int, Dict[str, discord.ForumTag]]] = {}
+
+# Machine avatars in embeds are paths relative to the labs site
+HTB_AVATAR_PREFIX = "https://labs.hackthebox.com"
+
+# Embed lookup tables, built once at import
+_DEFAULT_COLOR = discord.Color.blue()
+_DIFFICULTY_COLORS = MappingProxyType({
+    "easy": discord.Color.green(),
+    "medium": discord.Color.orange(),
+    "hard": discord.Color.red(),
+    "insane": discord.Color.from_rgb(0, 0, 0),
+})
+_DEFAULT_NOTICE_TYPE = (_DEFAULT_COLOR, "ℹ️")
+_NOTICE_TYPE_CONFIG = MappingProxyType({
+    "error": (discord.Color.red(), "❌"),
+    "warning": (discord.Color.orange(), "⚠️"),
+    "success": (discord.Color.green(), "✅"),
+})
+
+# Permission name -> bit, for testing required permissions with a single mask
+_PERM_FLAGS = MappingProxyType(dict(discord.Permissions.VALID_FLAGS))
+
+# Permissions needed to create a voice channel scheduled event
+_REQUIRED_GUILD_PERM = discord.Permissions(manage_events=True).value
+_REQUIRED_VOICE_PERM = discord.Permissions(view_channel=True, connect=True).value
+
+@functools.lru_cache(maxsize=64)
+def _permission_mask(names: Tuple[str, ...]) -> Optional[int]:
+    """Fold permission names into a bitmask; None if any name is unknown."""
+    mask = 0
+    for name in names:
+        bit = _PERM_FLAGS.get(name)
+        if bit is None:
+            return None
+        mask |= bit
+    return mask
+
+# Largest image body accepted from a download, and the chunk size it is read in
+MAX_IMAGE_BYTES = 8 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 65536
+
+# Seconds allowed for a whole image download, request and body
+DOWNLOAD_TIMEOUT = 30
+
+# URLs whose last download failed are skipped for a short while instead of retried
+DOWNLOAD_NEGATIVE_TTL = 60
+_failed_downloads = TTLCache(maxsize=256, ttl=DOWNLOAD_NEGATIVE_TTL)
+
+# Shared HTTP session for image downloads, created lazily on the running loop
+_session: Optional[aiohttp.ClientSession] = None
+
+async def get_session() -> aiohttp.ClientSession:
+    """Get the shared download session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, limit_per_host=16, ttl_dns_cache=300, keepalive_timeout=75),
+            # Downloads bound themselves with asyncio.timeout instead
+            timeout=aiohttp.ClientTimeout(total=None)
+        )
+    return _session
+
+async def close_session() -> None:
+    """Close the shared download session and drop caches bound to the old client."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+    # Cached channels and tags belong to the client being closed; a restart builds a new one
+    _channel_cache.clear()
+    _forum_tag_cache.clear()
+
+@functools.lru_cache(maxsize=1024)
+def _format_ts_cached(iso_date: str, offset_hours: int) -> str:
+    """Format an ISO date as a Discord timestamp; raises on bad input so failures aren't cached."""
+    # fromisoformat accepts a trailing "Z" on 3.11+, and timestamp() is already absolute
+    timestamp = datetime.fromisoformat(iso_date).timestamp() + offset_hours * 3600
+    return f"<t:{int(timestamp)}:F>"
+
 class DiscordHelpers:
     """Helper class for Discord operations."""
 
     @staticmethod
     def get_embed_color(difficulty: str) -> discord.Color:
         """Get embed color based on difficulty."""
-        difficulty_colors = {
-            "easy": discord.Color.green(),
-            "medium": discord.Color.orange(),
-            "hard": discord.Color.red(),
-            "insane": discord.Color.from_rgb(0, 0, 0),
-        }
-        return difficulty_colors.get(difficulty.lower(), discord.Color.blue())
+        return _DIFFICULTY_COLORS.get(difficulty.lower(), _DEFAULT_COLOR)
 
     @staticmethod
     async def download_image(url: str, for_event: bool = False) -> Optional[bytes]:
@@ -30,31 +116,55 @@ class DiscordHelpers:
             logger.warning("Empty URL provided for image download")
             return None
 
+        if url in _failed_downloads:
+            logger.debug("Skipping recently failed image download: %s", url)
+            return None
+
+        data = await DiscordHelpers._fetch_image(url)
+        if data is None:
+            _failed_downloads.set(url, True)
+        return data
+
+    @staticmethod
+    async def _fetch_image(url: str) -> Optional[bytes]:
+        """Fetch and validate an image body, returning None on any failure."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            session = await get_session()
+            async with asyncio.timeout(DOWNLOAD_TIMEOUT):
+                async with session.get(url) as response:
                     if response.status == 200:
-                        data = await response.read()
+                        if response.content_length and response.content_length > MAX_IMAGE_BYTES:
+                            logger.warning("Image too large from %s (%d bytes advertised)", url, response.content_length)
+                            return None
+
+                        # Stream the body so an oversized or lying response can't be buffered whole
+                        buf = bytearray()
+                        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                            buf += chunk
+                            if len(buf) > MAX_IMAGE_BYTES:
+                                logger.warning("Image too large from %s (over %d bytes)", url, MAX_IMAGE_BYTES)
+                                return None
+                        data = bytes(buf)
 
                         if not data:
-                            logger.warning(f"Empty image data from {url}")
+                            logger.warning("Empty image data from %s", url)
                             return None
 
                         # Basic size validation
                         if len(data) < 100:
-                            logger.warning(f"Image data too small from {url} ({len(data)} bytes)")
+                            logger.warning("Image data too small from %s (%d bytes)", url, len(data))
                             return None
 
-                        logger.debug(f"Downloaded image from {url}: {len(data)} bytes")
+                        logger.debug("Downloaded image from %s: %d bytes", url, len(data))
                         return data
                     else:
-                        logger.warning(f"Failed to download image: {url} (status: {response.status})")
+                        logger.warning("Failed to download image: %s (status: %s)", url, response.status)
                         return None
         except asyncio.TimeoutError:
-            logger.error(f"Timeout downloading image from {url}")
+            logger.error("Timeout downloading image from %s", url)
             return None
-        except Exception as e:
-            logger.error(f"Error downloading image {url}: {e}")
+        except Exception:
+            logger.exception("Error downloading image %s", url)
             return None
 
     @staticmethod
@@ -66,31 +176,58 @@ class DiscordHelpers:
             if channel is not None:
                 return channel
 
+            # Reuse a recent API result before paying another round trip
+            channel = _channel_cache.get(channel_id)
+            if channel is _NO_CHANNEL:
+                return None
+            if channel is not None:
+                return channel
+
             # Fallback to API
             try:
                 channel = await client.fetch_channel(channel_id)
+                _channel_cache.set(channel_id, channel)
                 return channel
             except discord.NotFound:
-                logger.error(f"Channel {channel_id} not found")
+                logger.error("Channel %s not found", channel_id)
+                _channel_cache.set(channel_id, _NO_CHANNEL, ttl=CHANNEL_NEGATIVE_TTL)
                 return None
             except discord.Forbidden:
-                logger.error(f"Bot lacks permission to view channel {channel_id}")
+                logger.error("Bot lacks permission to view channel %s", channel_id)
+                _channel_cache.set(channel_id, _NO_CHANNEL, ttl=CHANNEL_NEGATIVE_TTL)
                 return None
 
         except Exception as e:
-            logger.error(f"Error resolving channel {channel_id}: {e}")
+            logger.error("Error resolving channel %s: %s", channel_id, e)
             return None
 
+    @staticmethod
+    async def prepare_event_assets(client: discord.Client, channel_id: int, image_url: Optional[str] = None
+                                   ) -> Tuple[Optional[discord.abc.GuildChannel], Optional[bytes]]:
+        """Resolve a channel and download an image concurrently."""
+        if not image_url:
+            return await DiscordHelpers.resolve_channel(client, channel_id), None
+
+        channel, image_data = await asyncio.gather(
+            DiscordHelpers.resolve_channel(client, channel_id),
+            DiscordHelpers.download_image(image_url, for_event=True),
+            return_exceptions=True
+        )
+
+        # Both helpers log their own failures; anything that still escaped counts as missing
+        if isinstance(channel, BaseException):
+            channel = None
+        if isinstance(image_data, BaseException):
+            image_data = None
+        return channel, image_data
+
     @staticmethod
     def format_discord_timestamp(iso_date: str, offset_hours: int = 0) -> str:
         """Format ISO date string to Discord timestamp."""
         try:
-            release_date = datetime.fromisoformat(iso_date.replace("Z", "+00:00")).astimezone(timezone.utc)
-            if offset_hours:
-                release_date = release_date + timedelta(hours=offset_hours)
-            return f"<t:{int(release_date.timestamp())}:F>"
+            return _format_ts_cached(iso_date, offset_hours)
         except Exception as e:
-            logger.error(f"Error formatting timestamp {iso_date}: {e}")
+            logger.error("Error formatting timestamp %s: %s", iso_date, e)
             return iso_date
 
     @staticmethod
@@ -103,14 +240,19 @@ class DiscordHelpers:
             else:
                 perms = member.guild_permissions
 
+            required_mask = _permission_mask(tuple(required_perms))
+            if required_mask is not None and perms.value & required_mask == required_mask:
+                return True
+
+            # Cold path: find which permission is missing for the log
             for perm in required_perms:
                 if not getattr(perms, perm, False):
-                    logger.warning(f"Missing permission '{perm}' in channel {channel.name}")
-                    return False
-            return True
+                    logger.warning("Missing permission '%s' in channel %s", perm, channel.name)
+                    break
+            return False
 
         except Exception as e:
-            logger.error(f"Error checking permissions: {e}")
+            logger.error("Error checking permissions: %s", e)
             return False
 
     @staticmethod
@@ -118,42 +260,43 @@ class DiscordHelpers:
         """Create Discord embed for machine."""
         creator = machine['firstCreator'][0]['name'] if machine.get('firstCreator') else 'Unknown'
 
-        embed_color = DiscordHelpers.get_embed_color(machine['difficulty_text'])
-        embed = discord.Embed(
-            title=f"Machine: **{machine['name']}**",
-            description=f"Release Date: {DiscordHelpers.format_discord_timestamp(machine['release'])}",
-            color=embed_color
-        )
-        embed.add_field(name="Difficulty", value=machine['difficulty_text'], inline=True)
-        embed.add_field(name="Operating System", value=machine['os'], inline=True)
-        embed.add_field(name="Creator", value=creator, inline=True)
+        fields = [
+            {"name": "Difficulty", "value": str(machine['difficulty_text']), "inline": True},
+            {"name": "Operating System", "value": str(machine['os']), "inline": True},
+            {"name": "Creator", "value": str(creator), "inline": True},
+        ]
 
         if 'retiring' in machine and machine['retiring']:
             retiring = machine['retiring']
-            embed.add_field(
-                name="Retiring Machine",
-                value=f"{retiring['name']} ({retiring['difficulty_text']}) - {retiring['os']}",
-                inline=False
-            )
-
+            fields.append({
+                "name": "Retiring Machine",
+                "value": f"{retiring['name']} ({retiring['difficulty_text']}) - {retiring['os']}",
+                "inline": False
+            })
+
+        payload = {
+            "title": f"Machine: **{machine['name']}**",
+            "description": f"Release Date: {DiscordHelpers.format_discord_timestamp(machine['release'])}",
+            "color": DiscordHelpers.get_embed_color(machine['difficulty_text']).value,
+            "fields": fields,
+        }
         if machine.get('avatar'):
-            embed.set_thumbnail(url=f"https://labs.hackthebox.com{machine['avatar']}")
+            payload["thumbnail"] = {"url": HTB_AVATAR_PREFIX + machine['avatar']}
 
-        return embed
+        return discord.Embed.from_dict(payload)
 
     @staticmethod
     def create_challenge_embed(challenge: Dict[str, Any]) -> discord.Embed:
         """Create Discord embed for challenge."""
-        embed_color = DiscordHelpers.get_embed_color(challenge['difficulty'])
-        embed = discord.Embed(
-            title=f"Challenge: **{challenge['name']}**",
-            description=f"Release Date: {DiscordHelpers.format_discord_timestamp(challenge['release_date'])}",
-            color=embed_color
-        )
-        embed.add_field(name="Difficulty", value=challenge['difficulty'], inline=True)
-        embed.add_field(name="Category", value=challenge['category_name'], inline=True)
-
-        return embed
+        return discord.Embed.from_dict({
+            "title": f"Challenge: **{challenge['name']}**",
+            "description": f"Release Date: {DiscordHelpers.format_discord_timestamp(challenge['release_date'])}",
+            "color": DiscordHelpers.get_embed_color(challenge['difficulty']).value,
+            "fields": [
+                {"name": "Difficulty", "value": str(challenge['difficulty']), "inline": True},
+                {"name": "Category", "value": str(challenge['category_name']), "inline": True},
+            ],
+        })
 
     @staticmethod
     def create_notice_embed(notice: Dict[str, Any]) -> discord.Embed:
@@ -164,12 +307,7 @@ class DiscordHelpers:
         notice_type = notice.get("type", "info")
 
         # Get appropriate color and emoji
-        type_config = {
-            "error": (discord.Color.red(), "❌"),
-            "warning": (discord.Color.orange(), "⚠️"),
-            "success": (discord.Color.green(), "✅"),
-        }
-        color, emoji = type_config.get(notice_type, (discord.Color.blue(), "ℹ️"))
+        color, emoji = _NOTICE_TYPE_CONFIG.get(notice_type, _DEFAULT_NOTICE_TYPE)
 
         embed = discord.Embed(
             title=f"{emoji} {notice_type.capitalize()} Notice for {machine_name}",
@@ -179,13 +317,30 @@ class DiscordHelpers:
 
         return embed
 
+    @staticmethod
+    def get_forum_tags(forum_channel: discord.ForumChannel) -> Dict[str, discord.ForumTag]:
+        """Get the forum's tags keyed by lowercased name, cached per forum."""
+        tags = forum_channel.available_tags
+        cached = _forum_tag_cache.get(forum_channel.id)
+        if cached is not None and cached[0] == len(tags):
+            return cached[1]
+
+        mapping = {tag.name.lower(): tag for tag in tags}
+        _forum_tag_cache[forum_channel.id] = (len(tags), mapping)
+        return mapping
+
+    @staticmethod
+    def invalidate_forum_tags(channel_id: int) -> None:
+        """Drop a forum's cached tag mapping, e.g. after its tags were edited."""
+        _forum_tag_cache.pop(channel_id, None)
+
     @staticmethod
     async def create_forum_thread(forum_channel: discord.ForumChannel, name: str, content: str,
                                  tags: list, file: Optional[discord.File] = None) -> Optional[discord.Thread]:
         """Create a forum thread with tags."""
         try:
             # Map tag names to tag objects
-            available_tags = {tag.name.lower(): tag for tag in forum_channel.available_tags}
+            available_tags = DiscordHelpers.get_forum_tags(forum_channel)
             applied_tags = []
 
             for tag_name in tags:
@@ -194,10 +349,10 @@ class DiscordHelpers:
                     if tag:
                         applied_tags.append(tag)
                     else:
-                        logger.warning(f"Tag '{tag_name}' not found in forum {forum_channel.name}")
+                        logger.warning("Tag '%s' not found in forum %s", tag_name, forum_channel.name)
 
             if not applied_tags:
-                logger.error(f"No valid tags found for forum thread in {forum_channel.name}")
+                logger.error("No valid tags found for forum thread in %s", forum_channel.name)
                 return None
 
             # Create thread - only include file if we have valid data
@@ -213,11 +368,11 @@ class DiscordHelpers:
 
             thread_with_message = await forum_channel.create_thread(**thread_kwargs)
 
-            logger.info(f"Created forum thread: {name} in {forum_channel.name}")
+            logger.info("Created forum thread: %s in %s", name, forum_channel.name)
             return thread_with_message.thread
 
-        except Exception as e:
-            logger.error(f"Failed to create forum thread '{name}': {e}")
+        except Exception:
+            logger.exception("Failed to create forum thread '%s'", name)
             return None
 
     @staticmethod
@@ -235,16 +390,16 @@ class DiscordHelpers:
             # Check permissions - get bot member from guild
             me = guild.me
             if not me:
-                logger.error(f"Bot is not a member of guild {guild.name}")
+                logger.error("Bot is not a member of guild %s", guild.name)
                 return False
 
-            if not me.guild_permissions.manage_events:
-                logger.error(f"Bot lacks 'Manage Events' permission in {guild.name}")
+            if me.guild_permissions.value & _REQUIRED_GUILD_PERM != _REQUIRED_GUILD_PERM:
+                logger.error("Bot lacks 'Manage Events' permission in %s", guild.name)
                 return False
 
             channel_perms = voice_channel.permissions_for(me)
-            if not (channel_perms.view_channel and channel_perms.connect):
-                logger.error(f"Bot lacks voice channel permissions in {voice_channel.name}")
+            if channel_perms.value & _REQUIRED_VOICE_PERM != _REQUIRED_VOICE_PERM:
+                logger.error("Bot lacks voice channel permissions in %s", voice_channel.name)
                 return False
 
             # Ensure description is not too long (Discord limit is 1000 characters)
@@ -267,11 +422,9 @@ class DiscordHelpers:
 
             await guild.create_scheduled_event(**event_kwargs)
 
-            logger.info(f"Created Discord event: {name}")
+            logger.info("Created Discord event: %s", name)
             return True
 
-        except Exception as e:
-            import traceback
-            logger.error(f"Failed to create Discord event '{name}': {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Failed to create Discord event '%s'", name)
             return False
\ No newline at end of file
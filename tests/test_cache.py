@@ -0,0 +1,102 @@
+"""Tests for the TTL cache."""
+
+import pytest
+
+from htb_discord.utils import cache as cache_module
+from htb_discord.utils.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_stored_value(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert "a" in cache
+    assert len(cache) == 1
+
+
+def test_missing_key_returns_default(clock):
+    cache = TTLCache()
+
+    assert cache.get("missing") is None
+    assert cache.get("missing", "fallback") == "fallback"
+    assert "missing" not in cache
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+
+    clock[0] += 9.9
+    assert cache.get("a") == 1
+
+    clock[0] += 0.1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_per_entry_ttl_overrides_default(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("short", 1, ttl=1)
+    cache.set("long", 2)
+
+    clock[0] += 1
+    assert "short" not in cache
+    assert cache.get("long") == 2
+
+
+def test_falsy_values_are_cached(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("empty", {})
+
+    assert "empty" in cache
+    assert cache.get("empty", "default") == {}
+
+
+def test_evicts_least_recently_used(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Touching "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_set_existing_key_refreshes_recency_and_expiry(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    clock[0] += 5
+    cache.set("a", 10)
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    clock[0] += 9
+    assert cache.get("a") == 10
+
+
+def test_pop_and_clear(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "gone") == "gone"
+
+    cache.clear()
+    assert len(cache) == 0
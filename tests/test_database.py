@@ -0,0 +1,213 @@
+"""Tests for the database utilities."""
+
+import asyncio
+import logging
+import sqlite3
+import time
+
+import pytest
+
+from htb_discord.utils.database import DatabaseManager, DatabaseWriter, link_hash
+
+
+class FakeConfig:
+    """Minimal stand-in for Config backed by a flat dict."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+@pytest.fixture
+def db_config(tmp_path):
+    return FakeConfig({
+        'database.machines_db': str(tmp_path / 'machines.db'),
+        'database.challenges_db': str(tmp_path / 'challenges.db'),
+        'database.notices_db': str(tmp_path / 'notices.db'),
+        'database.links_db': str(tmp_path / 'links.db'),
+    })
+
+
+@pytest.fixture
+def db_manager(db_config):
+    manager = DatabaseManager(db_config)
+    yield manager
+    manager.close_all()
+
+
+@pytest.fixture
+async def writer():
+    writer = DatabaseWriter()
+    task = asyncio.create_task(writer.run())
+    await asyncio.sleep(0)
+    yield writer
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    writer.close()
+
+
+async def test_writer_runs_writes_in_submission_order(writer):
+    order = []
+
+    def write(value, delay):
+        time.sleep(delay)
+        order.append(value)
+        return value
+
+    # Earlier writes sleep longer; they must still finish first
+    futures = [writer.submit(write, i, 0.01 * (5 - i)) for i in range(5)]
+
+    assert await asyncio.gather(*futures) == [0, 1, 2, 3, 4]
+    assert order == [0, 1, 2, 3, 4]
+
+
+async def test_writer_propagates_errors_without_stopping(writer):
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await writer.submit(fail)
+
+    # The worker keeps consuming after a failed write
+    assert await writer.submit(lambda: "ok") == "ok"
+
+
+async def test_writer_without_worker_runs_directly():
+    writer = DatabaseWriter()
+    try:
+        assert await writer.submit(lambda: 42) == 42
+    finally:
+        writer.close()
+
+
+async def test_writer_drains_queue_on_cancel():
+    writer = DatabaseWriter()
+    task = asyncio.create_task(writer.run())
+    await asyncio.sleep(0)
+
+    done = []
+    futures = [writer.submit(done.append, i) for i in range(3)]
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    await asyncio.gather(*futures)
+    writer.close()
+    assert done == [0, 1, 2]
+
+
+async def test_async_writes_and_reads_round_trip(db_manager):
+    writer_task = asyncio.create_task(db_manager.writer.run())
+    try:
+        assert await db_manager.add_notice_async(1) is True
+        assert await db_manager.add_notice_async(1) is False
+
+        existing = await db_manager.existing_ids_async('notices', 'sent_notices', [1, 2])
+        assert existing == {1}
+    finally:
+        writer_task.cancel()
+        await asyncio.gather(writer_task, return_exceptions=True)
+
+
+def test_unknown_database_is_rejected(db_manager):
+    with pytest.raises(ValueError):
+        with db_manager.get_connection('nope'):
+            pass
+
+
+def _create_legacy_links_db(path, links):
+    """Create a links database as older releases did: no link_hash, duplicates allowed."""
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE links (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            channel_name TEXT,
+            link TEXT,
+            processed INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.executemany('INSERT INTO links (channel_name, link) VALUES (?, ?)', links)
+    conn.commit()
+    conn.close()
+
+
+def test_links_migration_dedups_and_backfills(db_config, caplog):
+    _create_legacy_links_db(db_config.get('database.links_db'), [
+        ('general', 'https://a.example'),
+        ('general', 'https://b.example'),
+        ('other', 'https://a.example'),
+        ('other', 'https://b.example'),
+        ('other', 'https://c.example'),
+    ])
+
+    with caplog.at_level(logging.INFO, logger='htb_discord.utils.database'):
+        manager = DatabaseManager(db_config)
+    try:
+        assert "Removed 2 duplicate links" in caplog.text
+
+        # The first occurrence of each link survives
+        assert manager.get_unprocessed_links(limit=10) == [
+            (1, 'general', 'https://a.example'),
+            (2, 'general', 'https://b.example'),
+            (5, 'other', 'https://c.example'),
+        ]
+
+        with manager.get_connection('links') as conn:
+            hashes = dict(conn.execute('SELECT link, link_hash FROM links'))
+        assert hashes == {link: link_hash(link) for link in hashes}
+
+        # The hash index now rejects duplicates
+        assert manager.save_link('general', 'https://a.example') is False
+        assert manager.save_link('general', 'https://d.example') is True
+    finally:
+        manager.close_all()
+
+
+def test_links_migration_runs_once(db_config, caplog):
+    DatabaseManager(db_config).close_all()
+
+    # Swap in a looser index under the same name so duplicates can be inserted;
+    # its presence alone must keep later boots from re-running the dedup
+    conn = sqlite3.connect(db_config.get('database.links_db'))
+    conn.execute('DROP INDEX idx_links_link_hash')
+    conn.execute('CREATE UNIQUE INDEX idx_links_link_hash ON links(id, link_hash)')
+    conn.executemany(
+        'INSERT INTO links (channel_name, link, link_hash) VALUES (?, ?, ?)',
+        [('general', 'https://a.example', link_hash('https://a.example'))] * 2
+    )
+    conn.commit()
+    conn.close()
+
+    with caplog.at_level(logging.INFO, logger='htb_discord.utils.database'):
+        manager = DatabaseManager(db_config)
+    try:
+        assert "duplicate links" not in caplog.text
+        assert len(manager.get_unprocessed_links(limit=10)) == 2
+    finally:
+        manager.close_all()
+
+
+def test_unprocessed_links_after_pages_and_wraps(db_manager):
+    for i in range(5):
+        db_manager.save_link('general', f'https://{i}.example')
+
+    # Walk the table two links at a time, failing the link with id 2
+    seen = []
+    last_id = 0
+    while True:
+        page = db_manager.get_unprocessed_links_after(last_id, limit=2)
+        if not page:
+            break
+        last_id = page[-1][0]
+        for link_id, _, _ in page:
+            seen.append(link_id)
+            if link_id != 2:
+                db_manager.mark_link_processed(link_id)
+
+    assert seen == [1, 2, 3, 4, 5]
+    assert db_manager.get_unprocessed_links_after(last_id, limit=2) == []
+
+    # Starting over from the beginning picks up the failed link again
+    assert db_manager.get_unprocessed_links_after(0, limit=2) == [(2, 'general', 'https://1.example')]
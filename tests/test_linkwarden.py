@@ -0,0 +1,85 @@
+"""Tests for the Linkwarden forwarder."""
+
+import asyncio
+
+import pytest
+
+discord = pytest.importorskip("discord")
+
+from htb_discord.modules.linkwarden import LinkwardenForwarder  # noqa: E402
+from htb_discord.utils.database import DatabaseManager  # noqa: E402
+
+
+class FakeConfig:
+    """Minimal stand-in for Config backed by a flat dict."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    manager = DatabaseManager(FakeConfig({
+        'database.machines_db': str(tmp_path / 'machines.db'),
+        'database.challenges_db': str(tmp_path / 'challenges.db'),
+        'database.notices_db': str(tmp_path / 'notices.db'),
+        'database.links_db': str(tmp_path / 'links.db'),
+    }))
+    writer_task = asyncio.create_task(manager.writer.run())
+    yield manager
+    writer_task.cancel()
+    await asyncio.gather(writer_task, return_exceptions=True)
+    manager.close_all()
+
+
+async def test_pending_links_wrap_around_to_retry_failures(db_manager):
+    forwarder = LinkwardenForwarder(FakeConfig({
+        'api.linkwarden_api_url': 'https://links.example',
+        'api.linkwarden_token': 'token',
+        'features.linkwarden.rate_limit': {'links_per_batch': 2},
+    }), db_manager, client=None)
+
+    for i in range(3):
+        db_manager.save_link('general', f'https://{i}.example')
+
+    attempts = []
+    failing = {'https://0.example'}
+
+    async def send(channel_name, link):
+        attempts.append(link)
+        return link not in failing
+
+    forwarder.send_link_to_linkwarden = send
+
+    # Two pages, then an empty page that resets the cursor
+    await forwarder.process_pending_links()
+    await forwarder.process_pending_links()
+    await forwarder.process_pending_links()
+    assert forwarder.last_link_id == 0
+    assert attempts == ['https://0.example', 'https://1.example', 'https://2.example']
+
+    # The next pass starts over and retries only the failed link
+    failing.clear()
+    await forwarder.process_pending_links()
+    assert attempts[-1] == 'https://0.example'
+    assert db_manager.get_unprocessed_links() == []
+
+
+async def test_stop_on_plain_client_detaches_listener(db_manager):
+    client = discord.Client(intents=discord.Intents.none())
+    forwarder = LinkwardenForwarder(FakeConfig({
+        'api.linkwarden_api_url': 'https://links.example',
+        'api.linkwarden_token': 'token',
+    }), db_manager, client)
+
+    forwarder._add_message_listener()
+    assert client.on_message == forwarder.on_message
+
+    await forwarder.stop()
+    assert not hasattr(client, 'on_message')
+
+    # Stopping a forwarder that never started is harmless too
+    await forwarder.stop()